@@ -0,0 +1,145 @@
+""" An append-only audit log of deck snapshots.
+
+    Each record holds the card ids of a deck snapshot as one byte per
+    card, the seed it was shuffled with (if any), its shuffle count and the
+    time it was logged. Records are chained: each starts with the SHA-256
+    digest of the record before it and ends with the digest of itself, so
+    changing, removing or reordering any record breaks every digest after
+    it. The log is read through mmap so replaying one hand out of a long
+    session doesn't read the whole file.
+"""
+
+import hashlib
+import mmap
+import os
+import struct
+import time
+from collections import namedtuple
+from . import playingcard as pc
+
+MAGIC = b'PDAL'
+VERSION = 1
+HEADER = struct.Struct('<4sH')  # magic, version
+RECORD = struct.Struct('<32sdIBHH')  # previous digest, time, shuffles, seeded, seed length, cards
+DIGEST_SIZE = hashlib.sha256().digest_size
+GENESIS = bytes(DIGEST_SIZE)
+
+Record = namedtuple('Record', ['index', 'ids', 'seed', 'shuffles', 'time', 'digest'])
+
+
+def encode(snapshot, previous=GENESIS, logged=None):
+    """ Returns the bytes of a record for a snapshot chained to the previous
+        digest. Seeds are stored as text.
+    """
+    seed = b'' if snapshot.seed is None else str(snapshot.seed).encode('utf-8')
+    body = RECORD.pack(previous, time.time() if logged is None else logged, snapshot.shuffles,
+                       snapshot.seed is not None, len(seed), len(snapshot.ids))
+    body += seed + bytes(snapshot.ids)
+    return body + hashlib.sha256(body).digest()
+
+
+def decode(data, offset=0, index=0):
+    """ Reads the record at offset and returns (Record, previous digest,
+        offset of the next record). Raises a ValueError if the record is cut
+        short or its digest doesn't match.
+    """
+    if offset + RECORD.size > len(data):
+        raise ValueError('Audit record {} is truncated!'.format(index))
+    previous, logged, shuffles, seeded, seedlen, count = RECORD.unpack_from(data, offset)
+    start = offset + RECORD.size
+    end = start + seedlen + count
+    if end + DIGEST_SIZE > len(data):
+        raise ValueError('Audit record {} is truncated!'.format(index))
+
+    digest = bytes(data[end:end + DIGEST_SIZE])
+    if hashlib.sha256(data[offset:end]).digest() != digest:
+        raise ValueError('Audit record {} does not match its digest!'.format(index))
+
+    seed = bytes(data[start:start + seedlen]).decode('utf-8') if seeded else None
+    ids = bytes(data[start + seedlen:end])
+    return Record(index, ids, seed, shuffles, logged, digest), previous, end + DIGEST_SIZE
+
+
+class AuditLog(object):
+    """ An audit file of deck snapshots that can only be appended to. The file
+        is created with a header if it doesn't exist; an existing file is
+        checked from end to end when it is opened.
+    """
+    def __init__(self, path):
+        self.path = path
+        self._offsets = []
+        self._last = GENESIS
+        if not os.path.exists(path) or os.path.getsize(path) == 0:
+            with open(path, 'wb') as f:
+                f.write(HEADER.pack(MAGIC, VERSION))
+        for record in self.records():
+            self._last = record.digest
+
+    def __len__(self):
+        return len(self._offsets)
+
+    def _read(self):
+        """ Returns a read-only mmap of the file after checking its header. """
+        with open(self.path, 'rb') as f:
+            data = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+
+        if len(data) < HEADER.size:
+            data.close()
+            raise ValueError('Audit file is truncated!')
+        magic, version = HEADER.unpack_from(data)
+        if magic != MAGIC:
+            data.close()
+            raise ValueError('Not an audit file!')
+        if version != VERSION:
+            data.close()
+            raise ValueError('Audit file version {} is not supported!'.format(version))
+        return data
+
+    def append(self, snapshot, logged=None):
+        """ Writes a snapshot to the end of the file, chained to the last
+            record, and returns its index.
+        """
+        record = encode(snapshot, self._last, logged)
+        with open(self.path, 'ab') as f:
+            offset = f.tell()
+            f.write(record)
+            f.flush()
+            os.fsync(f.fileno())
+
+        self._offsets.append(offset)
+        self._last = record[-DIGEST_SIZE:]
+        return len(self._offsets) - 1
+
+    def records(self):
+        """ Yields every Record in order, checking the chain as it goes. Raises
+            a ValueError at the first record that was changed or is out of
+            place.
+        """
+        offsets = []
+        with self._read() as data:
+            previous, offset = GENESIS, HEADER.size
+            while offset < len(data):
+                record, chained, end = decode(data, offset, len(offsets))
+                if chained != previous:
+                    raise ValueError('Audit record {} breaks the chain!'.format(record.index))
+                offsets.append(offset)
+                previous, offset = record.digest, end
+                yield record
+        self._offsets = offsets
+
+    def verify(self):
+        """ Checks the whole chain and returns how many records it holds. """
+        count = 0
+        for count, _ in enumerate(self.records(), 1):
+            pass
+        return count
+
+    def record(self, index):
+        """ Returns the Record at an index, checking its own digest. """
+        index = range(len(self._offsets))[index]
+        with self._read() as data:
+            return decode(data, self._offsets[index], index)[0]
+
+    def replay(self, index):
+        """ Returns new cards in the order the deck logged at index deals them. """
+        return [pc.INTERNED[i].copy() for i in self.record(index).ids]
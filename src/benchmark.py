@@ -0,0 +1,173 @@
+""" Times the public evaluator functions on fixed, seeded corpora of 5, 6 and
+    7 card hands, and CardList against IndexedCardList on a 52 card deck and
+    an 8 deck shoe.
+
+    Results are saved as JSON so two runs can be compared for regressions:
+
+        python -m src.benchmark -o before.json
+        python -m src.benchmark -o after.json --compare before.json
+"""
+
+import argparse
+import json
+import platform
+import random
+import sys
+import time
+from . import cardlist as cl
+from . import evaluator as ev
+from . import playingcard as pc
+
+SEED = 0
+QTY = 2000
+REPEATS = 5
+SIZES = (5, 6, 7)
+THRESHOLD = 0.10
+CARDLIST_SIZES = (52, 416)
+
+# name: (function, builds its arguments from a hand outside of the timing)
+BENCHMARKS = {
+    'get_value': (ev.get_value, lambda h: (h,)),
+    'find_best_hand': (ev.find_best_hand, lambda h: (h,)),
+    'dominant_suit': (ev.dominant_suit, lambda h: (h,)),
+    'is_straight': (ev.is_straight, lambda h: (h,)),
+    'rank_list': (ev.rank_list, lambda h: (h,)),
+    'get_description': (ev.get_description, lambda h: (ev.get_value(h), h)),
+}
+
+# name: function called with a card list and a probe card. Discards put the
+# card back so the list stays the same size.
+CARDLIST_TESTS = {
+    'count_rank': lambda l, c: l.count_rank(c.rank),
+    'count_suit': lambda l, c: l.count_suit(c.suit),
+    'contains': lambda l, c: c in l,
+    'discard': lambda l, c: l.add(l.discard(c)),
+}
+# name: (card list class, function)
+CARDLIST_BENCHMARKS = {'{}.{}'.format(cls.__name__, name): (cls, test)
+                       for cls in (cl.CardList, cl.IndexedCardList)
+                       for name, test in CARDLIST_TESTS.items()}
+
+
+def corpus(size, qty=QTY, seed=SEED):
+    """ Returns qty random hands of size cards. The same seed and size always
+        deal the same hands.
+    """
+    rng = random.Random('{}:{}'.format(seed, size))
+    deck = pc.std_deck()
+    return [rng.sample(deck, size) for _ in range(qty)]
+
+
+def card_corpus(size, qty=QTY, seed=SEED):
+    """ Returns a shoe of size cards (whole decks) and qty cards picked from
+        it at random. The same seed and size always pick the same cards.
+    """
+    rng = random.Random('{}:cards:{}'.format(seed, size))
+    shoe = [c for _ in range(size // len(pc.std_deck())) for c in pc.std_deck()]
+    return shoe, [rng.choice(shoe) for _ in range(qty)]
+
+
+def time_calls(func, calls, repeats=REPEATS):
+    """ Returns the fastest of repeats passes over calls in microseconds per
+        call.
+    """
+    best = float('inf')
+    for _ in range(repeats):
+        start = time.perf_counter()
+        for args in calls:
+            func(*args)
+        best = min(best, time.perf_counter() - start)
+    return best / len(calls) * 1e6
+
+
+def accepts(func, args):
+    """ Returns True if func can be called with args without a ValueError. """
+    try:
+        func(*args)
+    except ValueError:
+        return False
+    return True
+
+
+def run(names=None, sizes=SIZES, qty=QTY, repeats=REPEATS, seed=SEED,
+        cardlist_sizes=CARDLIST_SIZES):
+    """ Runs the benchmarks and returns a dictionary of the settings, the
+        microseconds per call for each 'name/size' and how many hands of each
+        were skipped because the function rejected them.
+    """
+    results, skipped = {}, {}
+    for size in sizes:
+        hands = corpus(size, qty, seed)
+        for name in [n for n in names or BENCHMARKS if n in BENCHMARKS]:
+            func, prepare = BENCHMARKS[name]
+            calls = [prepare(h) for h in hands]
+            calls = [args for args in calls if accepts(func, args)]
+            key = '{}/{}'.format(name, size)
+            skipped[key] = len(hands) - len(calls)
+            if calls:
+                results[key] = time_calls(func, calls, repeats)
+
+    for size in cardlist_sizes:
+        shoe, probes = card_corpus(size, qty, seed)
+        for name in [n for n in names or CARDLIST_BENCHMARKS if n in CARDLIST_BENCHMARKS]:
+            cls, func = CARDLIST_BENCHMARKS[name]
+            cards = cls(list(shoe))
+            results['{}/{}'.format(name, size)] = time_calls(func, [(cards, c) for c in probes], repeats)
+
+    return {
+        'python': platform.python_version(),
+        'machine': platform.machine(),
+        'seed': seed,
+        'qty': qty,
+        'repeats': repeats,
+        'results': results,
+        'skipped': skipped,
+    }
+
+
+def compare(old, new, threshold=THRESHOLD):
+    """ Returns a list of (key, old us, new us) for every benchmark that got
+        more than threshold slower between two runs.
+    """
+    slower = []
+    for key, before in sorted(old['results'].items()):
+        after = new['results'].get(key)
+        if after is not None and after > before * (1 + threshold):
+            slower.append((key, before, after))
+    return slower
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description='Benchmark the poker hand evaluator.')
+    parser.add_argument('-o', '--output', help='save the results to this JSON file')
+    parser.add_argument('-c', '--compare', help='flag regressions against this JSON file')
+    parser.add_argument('-n', '--qty', type=int, default=QTY, help='hands per corpus')
+    parser.add_argument('-r', '--repeats', type=int, default=REPEATS)
+    parser.add_argument('-t', '--threshold', type=float, default=THRESHOLD,
+                        help='slowdown ratio counted as a regression')
+    parser.add_argument('names', nargs='*', help='only run these benchmarks')
+    args = parser.parse_args(argv)
+    choices = list(BENCHMARKS) + list(CARDLIST_BENCHMARKS)
+    for name in args.names:
+        if name not in choices:
+            parser.error('unknown benchmark {}, choose from {}'.format(name, ', '.join(choices)))
+
+    report = run(args.names, qty=args.qty, repeats=args.repeats)
+    for key, us in report['results'].items():
+        print('{:<32}{:>10.2f}us'.format(key, us))
+
+    if args.output:
+        with open(args.output, 'w') as f:
+            json.dump(report, f, indent=2)
+
+    if args.compare:
+        with open(args.compare) as f:
+            slower = compare(json.load(f), report, args.threshold)
+        for key, before, after in slower:
+            print('REGRESSION {}: {:.2f}us -> {:.2f}us'.format(key, before, after))
+        return 1 if slower else 0
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
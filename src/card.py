@@ -9,6 +9,8 @@ BACK_TEXT = 'Xx'
 
 class Card(object):
     """Represents a card """
+    __slots__ = ('top_text', 'back_text', 'hidden')
+
     def __init__(self, top_text, back_text=BACK_TEXT):
         self.top_text = top_text
         self.back_text = back_text
@@ -3,6 +3,8 @@
 """
 import random
 
+MINCOMPACT = 16
+
 
 class CardList(object):
     def __init__(self, cards=None):
@@ -88,3 +90,95 @@ class CardList(object):
             leftovers. There can only be one suit passed.
         """
         return [c for c in self.cards if c.suit not in suits]
+
+
+class IndexedCardList(CardList):
+    """ A CardList of PlayingCards that keeps rank and suit counts and the
+        positions of each card id up to date as cards come and go, so
+        counting, membership and discards don't scan the list.
+
+        Discarded cards leave a gap that is skipped over; once more than half
+        the slots are gaps the list is packed again. The cards property
+        returns a new list in order, so changes to it aren't seen unless it
+        is assigned back.
+    """
+    def __init__(self, cards=None):
+        self.cards = cards or []
+
+    @property
+    def cards(self):
+        return [c for c in self._slots if c is not None]
+
+    @cards.setter
+    def cards(self, cards):
+        self._slots = list(cards)
+        self._dead = 0
+        self._index()
+
+    def _index(self):
+        """ Rebuilds the positions and counts from the slots. """
+        self._positions, self._ranks, self._suits = {}, {}, {}
+        for i, c in enumerate(self._slots):
+            if c is not None:
+                self._positions.setdefault(c.id, []).append(i)
+                self._ranks[c.rank] = self._ranks.get(c.rank, 0) + 1
+                self._suits[c.suit] = self._suits.get(c.suit, 0) + 1
+
+    def __contains__(self, c):
+        """ Returns True if the given Card is in the CardList, False otherwise. """
+        return bool(self._positions.get(c.id))
+
+    def __len__(self):
+        """ Returns how many cards there are. """
+        return len(self._slots) - self._dead
+
+    def add(self, card):
+        """ Adds a card. """
+        self._positions.setdefault(card.id, []).append(len(self._slots))
+        self._slots.append(card)
+        self._ranks[card.rank] = self._ranks.get(card.rank, 0) + 1
+        self._suits[card.suit] = self._suits.get(card.suit, 0) + 1
+
+    def count_suit(self, suit):
+        """ Counts how many cards of the given suit occur in the card list. """
+        return self._suits.get(suit, 0)
+
+    def count_rank(self, rank):
+        """ Counts how many cards of the given rank occur in the card list. """
+        return self._ranks.get(rank, 0)
+
+    def discard(self, card):
+        """ Removes a card and returns it. """
+        positions = self._positions.get(card.id)
+        if not positions:
+            raise ValueError('Card {} is not in this CardList!'.format(str(card)))
+
+        i = positions.pop(0)
+        copy, self._slots[i] = self._slots[i], None
+        self._ranks[copy.rank] -= 1
+        self._suits[copy.suit] -= 1
+        self._dead += 1
+        if self._dead > MINCOMPACT and self._dead > len(self._slots) // 2:
+            self.cards = self.cards
+        return copy
+
+    def is_empty(self):
+        """ Returns True if there are 0 cards, False otherwise. """
+        return len(self) == 0
+
+    def remove(self, c):
+        """ Removes the specified Card if it's here, or returns None if it isn't here. """
+        if c in self:
+            self.discard(c)
+        return None
+
+    def shuffle(self, x=1):
+        """ Shuffles the CardList once.  """
+        cards = self.cards
+        for _ in range(x):
+            random.shuffle(cards)
+        self.cards = cards
+
+    def sort(self):
+        """ Sorts the cards. """
+        self.cards = sorted(self.cards, key=lambda x: x.val())
@@ -0,0 +1,130 @@
+""" A CardSet is an immutable set of PlayingCards packed into one integer, with
+    bit n set for the card with id n. Set operations and counting suits or
+    ranks are a few integer operations instead of scans over a list, and
+    CardSets are hashable so they can be used as dictionary or cache keys.
+"""
+from . import cardlist
+from . import numtools
+from . import playingcard as pc
+
+SUITMASKS = {s: 0x1FFF << (13 * i) for i, s in enumerate(pc.SUITS)}
+SUITMASKS[pc.joker_suit] |= 1 << pc.JOKER_ID
+RANKMASKS = {r: sum(1 << (13 * i + v - 2) for i in range(len(pc.SUITS)))
+             for r, v in pc.RANKS.items() if r != pc.joker_rank}
+RANKMASKS[pc.joker_rank] = 1 << pc.JOKER_ID
+# (rank, suit) of each card id.
+CARD_TEXT = {i: (text[0], text[1]) for text, i in pc.CARD_IDS.items()}
+
+
+class CardSet(object):
+    __slots__ = ('_mask',)
+
+    def __init__(self, cards=None):
+        """ Builds the set from a CardList, or PlayingCards or ids. """
+        if isinstance(cards, cardlist.CardList):
+            cards = cards.cards
+        mask = 0
+        for c in cards or ():
+            mask |= 1 << (c if isinstance(c, int) else c.id)
+        self._mask = mask
+
+    @property
+    def mask(self):
+        """ The card id bits. Read only, since CardSets are hashed by it. """
+        return self._mask
+
+    @classmethod
+    def from_mask(cls, mask):
+        """ Returns the CardSet for a mask of card id bits. """
+        s = cls.__new__(cls)
+        s._mask = mask
+        return s
+
+    def __contains__(self, c):
+        """ Returns True if the given card (or id) is in the set. """
+        return self._mask >> (c if isinstance(c, int) else c.id) & 1 == 1
+
+    def __len__(self):
+        """ Returns how many cards there are. """
+        return numtools.popcount(self._mask)
+
+    def __iter__(self):
+        """ Yields a new PlayingCard for every card, in id order. """
+        for i in self.ids():
+            yield pc.Joker() if i == pc.JOKER_ID else pc.PlayingCard(*CARD_TEXT[i])
+
+    def __eq__(self, other):
+        return isinstance(other, CardSet) and self._mask == other._mask
+
+    def __hash__(self):
+        return hash(self._mask)
+
+    def __or__(self, other):
+        return CardSet.from_mask(self._mask | other._mask)
+
+    def __and__(self, other):
+        return CardSet.from_mask(self._mask & other._mask)
+
+    def __sub__(self, other):
+        return CardSet.from_mask(self._mask & ~other._mask)
+
+    def __xor__(self, other):
+        return CardSet.from_mask(self._mask ^ other._mask)
+
+    def __str__(self):
+        """ Returns the cards as text, like 'As Kh'. """
+        return ' '.join(CARD_TEXT[i][0] + CARD_TEXT[i][1] for i in self.ids())
+
+    def __repr__(self):
+        return 'CardSet({})'.format(str(self))
+
+    def ids(self):
+        """ Returns a list of the card ids, lowest first. """
+        ids, mask = [], self._mask
+        while mask:
+            low = mask & -mask
+            ids.append(low.bit_length() - 1)
+            mask ^= low
+        return ids
+
+    def add(self, card):
+        """ Returns a new set with the card (or id) added. """
+        return CardSet.from_mask(self._mask | 1 << (card if isinstance(card, int) else card.id))
+
+    def discard(self, card):
+        """ Returns a new set without the card (or id). Raises a ValueError if the
+            card is not here.
+        """
+        if card not in self:
+            raise ValueError('Card {} is not in this CardSet!'.format(card))
+        return CardSet.from_mask(self._mask & ~(1 << (card if isinstance(card, int) else card.id)))
+
+    def count_suit(self, suit):
+        """ Counts how many cards of the given suit are in the set. """
+        return numtools.popcount(self._mask & SUITMASKS[suit])
+
+    def count_rank(self, rank):
+        """ Counts how many cards of the given rank are in the set. """
+        return numtools.popcount(self._mask & RANKMASKS[rank])
+
+    def is_empty(self):
+        """ Returns True if there are 0 cards, False otherwise. """
+        return self._mask == 0
+
+    def strip_ranks(self, ranks):
+        """ Returns a new set without any cards of the given rank(s). """
+        mask = self._mask
+        for r in ranks:
+            mask &= ~RANKMASKS[r]
+        return CardSet.from_mask(mask)
+
+    def strip_suits(self, suits):
+        """ Returns a new set without any cards of the given suit(s). """
+        mask = self._mask
+        for s in suits:
+            mask &= ~SUITMASKS[s]
+        return CardSet.from_mask(mask)
+
+    def to_cardlist(self):
+        """ Returns the cards as a CardList of new PlayingCards. """
+        return cardlist.CardList(list(self))
@@ -3,10 +3,10 @@ def get_players(table, hascards=False, haschips=False):
         ordered from first after button, to Button Last. Can specify if seats
         have cards and/or chips.
     """
-    if table.TOKENS['D'] == -1:
+    if table.btn.seat == -1:
         btn = 0
     else:
-        btn = table.TOKENS['D']
+        btn = table.btn.seat
 
     length = len(table)
     first = (btn + 1) % length
@@ -1,17 +1,80 @@
+from array import array
+from . import deck_lazy as dl
 from . import deck_secure as ds
 from . import playingcard as pc
 
+PENETRATION = 0.75
+# Hi-Lo count of each rank index: 2-6 count +1, 7-9 count 0 and T-A count -1.
+HILO = (1, 1, 1, 1, 1, 0, 0, 0, -1, -1, -1, -1, -1)
+
 
 def mk_blackjack_deck(shoes):
     if shoes < 1:
         raise ValueError('BlackjackDeck must be passed a value of 1 or more for shoes!')
-    return pc.std_deck() * shoes
+    return [c for _ in range(shoes) for c in pc.std_deck()]
 
 
 class BlackjackDeck(ds.SecureDeck):
     """ Creates a blackjack deck with the specified number of 'shoes' included.
         4 shoes is the most common size for a Las Vegas blackjack deck.
     """
-    def __init__(self, shoes):
-        super(BlackjackDeck, self).__init__()
-        self.cards = mk_blackjack_deck(shoes)
+    def __init__(self, shoes, seed=None):
+        super(BlackjackDeck, self).__init__(seed)
+        self._cards = mk_blackjack_deck(shoes)
+
+
+class Shoe(dl.LazyDeck):
+    """ A multi-deck blackjack shoe kept as a compact array of card ids and
+        dealt with the same lazy Fisher-Yates shuffle as LazyDeck.
+
+        The cut card sits after penetration of the shoe has been dealt; once
+        it comes out, needs_shuffle is True and the shoe should be shuffled
+        after the round. The shoe counts how many of each rank have been
+        seen and keeps a Hi-Lo running count. shuffle() puts every card back
+        and clears the counts without building any new cards.
+    """
+    def __init__(self, decks=6, penetration=PENETRATION, seed=None):
+        if decks < 1:
+            raise ValueError('A shoe needs at least 1 deck!')
+        if not 0 < penetration <= 1:
+            raise ValueError('Penetration must be above 0 and at most 1!')
+        super(Shoe, self).__init__(seed, array('B', range(dl.DECKSIZE)) * decks)
+        self.decks = decks
+        self.cut = int(self._size * penetration)
+        self.seen = [0] * 13
+        self.running_count = 0
+
+    @property
+    def needs_shuffle(self):
+        """ True once the cut card has come out. """
+        return self._dealt >= self.cut
+
+    @property
+    def true_count(self):
+        """ The running count per deck left in the shoe. """
+        return self.running_count * dl.DECKSIZE / max(len(self), 1)
+
+    def remaining(self, rank):
+        """ Returns how many cards of the rank ('2' to 'A') are left. """
+        return 4 * self.decks - self.seen[pc.RANKS[rank] - 2]
+
+    def deal_id(self):
+        c = dl.LazyDeck.deal_id(self)
+        self.seen[c % 13] += 1
+        self.running_count += HILO[c % 13]
+        return c
+
+    def deal_ids(self, n):
+        ids = dl.LazyDeck.deal_ids(self, n)
+        for c in ids:
+            self.seen[c % 13] += 1
+            self.running_count += HILO[c % 13]
+        return ids
+
+    def shuffle(self):
+        """ Puts every card back in the shoe and clears the counts. """
+        self._dealt = self._fixed = 0
+        self.seen = [0] * 13
+        self.running_count = 0
+
+    reset = shuffle
@@ -10,6 +10,7 @@ def mk_joker_deck(jokers):
 
 
 class DeckJoker(ds.SecureDeck):
-    """ Creates a deck with one Joker. """
-    def __init__(self, jokers):
-        ds.SecureDeck.__init__(self)
+    """ Creates a deck with the given number of Jokers. """
+    def __init__(self, jokers=1, seed=None):
+        ds.SecureDeck.__init__(self, seed)
+        self._cards = mk_joker_deck(jokers)
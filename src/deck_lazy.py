@@ -0,0 +1,93 @@
+from . import deck_secure as ds
+from . import playingcard as pc
+
+DECKSIZE = 52
+CARDS = tuple(pc.std_deck())
+
+
+class LazyDeck(ds.SecureDeck):
+    """ A 52 card deck that is only shuffled as it is dealt. The deck is an
+        array of card ids and each deal swaps a random card from the rest of
+        the deck into the next spot: a Fisher-Yates shuffle stopped after the
+        cards that were actually dealt.
+
+        reset() puts every card back by resetting the dealt count, since any
+        order of the ids is as good a starting point as another.
+
+        snapshot() has to say which order the rest of the deck will be dealt
+        in, so it finishes the shuffle first; the ids before _fixed are
+        already in their final order and are dealt without a swap.
+    """
+    def __init__(self, seed=None, ids=None):
+        self._ids = list(range(DECKSIZE)) if ids is None else ids
+        self._size = len(self._ids)
+        self._dealt = 0
+        self._fixed = 0
+        self._set_source(seed)
+
+    def __len__(self):
+        """ Returns how many cards are in the deck. """
+        return self._size - self._dealt
+
+    def deal_id(self):
+        """ Picks a random card from the deck and returns its id. Raises an
+            exception if the deck is empty.
+        """
+        i = self._dealt
+        if i == self._size:
+            raise Exception('Deck is empty, cannot deal cards!')
+        ids = self._ids
+        if i >= self._fixed:
+            j = i + self._randbelow(self._size - i)
+            ids[i], ids[j] = ids[j], ids[i]
+        self._dealt = i + 1
+        return ids[i]
+
+    def deal_ids(self, n):
+        """ Picks n random cards from the deck and returns their ids. Raises an
+            exception if the deck does not have n cards.
+        """
+        if n < 0:
+            raise ValueError('Cannot deal a negative number of cards!')
+        elif n > len(self):
+            raise Exception('Deck does not have {} cards to deal!'.format(n))
+
+        ids, randbelow, start, size = self._ids, self._randbelow, self._dealt, self._size
+        for i in range(max(start, self._fixed), start + n):
+            j = i + randbelow(size - i)
+            ids[i], ids[j] = ids[j], ids[i]
+        self._dealt = start + n
+        return list(ids[start:start + n])
+
+    def deal(self):
+        """ Picks a random card from the deck and returns it as a new
+            PlayingCard. Raises an exception if the deck is empty.
+        """
+        c = CARDS[self.deal_id()]
+        return pc.PlayingCard(c.rank, c.suit)
+
+    def deal_many(self, n):
+        """ Picks n random cards from the deck and returns them as new
+            PlayingCards. Raises an exception if the deck does not have n cards.
+        """
+        return [pc.PlayingCard(CARDS[i].rank, CARDS[i].suit) for i in self.deal_ids(n)]
+
+    def _deal_order(self):
+        """ Finishes the shuffle of the cards left and returns their ids as
+            bytes in the order they will be dealt.
+        """
+        ids, randbelow, size = self._ids, self._randbelow, self._size
+        for i in range(max(self._dealt, self._fixed), size - 1):
+            j = i + randbelow(size - i)
+            ids[i], ids[j] = ids[j], ids[i]
+        self._fixed = size
+        return bytes(ids[self._dealt:size])
+
+    def shuffle(self):
+        """ Cards are picked at random as they are dealt, so there is nothing
+            to do.
+        """
+
+    def reset(self):
+        """ Puts every dealt card back in the deck. """
+        self._dealt = self._fixed = 0
@@ -1,5 +1,56 @@
+import os
+import random
+from collections import namedtuple
+from . import dealer
 from . import playingcard
 
+BUFFERSIZE = 4096
+
+# ids: card id bytes in the order they will be dealt, top card first.
+Snapshot = namedtuple('Snapshot', ['ids', 'seed', 'shuffles'])
+
+
+class EntropyBuffer(object):
+    """ Hands out random integers from OS entropy (os.urandom, the same source
+        as the secrets module). Bytes are read BUFFERSIZE at a time so a
+        shuffle doesn't make a system call for every swap.
+    """
+    def __init__(self, size=BUFFERSIZE):
+        self.size = size
+        self._buf = b''
+        self._pos = 0
+
+    def read(self, n):
+        """ Returns the next n random bytes. """
+        if self._pos + n > len(self._buf):
+            self._buf = self._buf[self._pos:] + os.urandom(max(self.size, n))
+            self._pos = 0
+        self._pos += n
+        return self._buf[self._pos - n:self._pos]
+
+    def randbelow(self, n):
+        """ Returns a uniform random integer from 0 to n - 1. Values from the top
+            of the byte range that would favour the lower results are thrown
+            away and redrawn.
+        """
+        if n <= 256:
+            limit = 256 - 256 % n
+            while True:
+                if self._pos >= len(self._buf):
+                    self._buf, self._pos = os.urandom(self.size), 0
+                x = self._buf[self._pos]
+                self._pos += 1
+                if x < limit:
+                    return x % n
+
+        size = ((n - 1).bit_length() + 7) // 8
+        span = 1 << (8 * size)
+        limit = span - span % n
+        while True:
+            x = int.from_bytes(self.read(size), 'little')
+            if x < limit:
+                return x % n
+
 
 class SecureDeck(object):
     """ Manages a deck of Cards using a stack structure.
@@ -11,11 +62,27 @@ class SecureDeck(object):
         Cards cannot be added.
 
         Eventually, a signature may be need to be able to access the deal function.
+
+        By default shuffle() draws from OS entropy. Passing a seed instead
+        shuffles with a seeded random.Random, so simulations can replay the
+        same decks.
     """
 
-    def __init__(self):
+    def __init__(self, seed=None):
         """ Initializes a new standard 52 card deck. """
         self._cards = playingcard.std_deck()
+        self._set_source(seed)
+
+    def _set_source(self, seed):
+        """ Picks OS entropy or a seeded random.Random to shuffle with. """
+        self.seed = seed
+        self.shuffles = 0
+        if seed is None:
+            self._entropy = EntropyBuffer()
+            self._randbelow = self._entropy.randbelow
+        else:
+            self._rng = random.Random(seed)
+            self._randbelow = self._rng.randrange
 
     def __len__(self):
         """ Returns how many cards are in the deck. """
@@ -30,6 +97,61 @@ class SecureDeck(object):
         else:
             raise Exception('Deck is empty, cannot deal cards!')
 
+    def deal_many(self, n):
+        """ Removes the top n cards off the deck in one go and returns them in
+            the order deal() would have. Raises an exception if the deck does
+            not have n cards.
+        """
+        if n < 0:
+            raise ValueError('Cannot deal a negative number of cards!')
+        elif n > len(self._cards):
+            raise Exception('Deck does not have {} cards to deal!'.format(n))
+        elif n == 0:
+            return []
+        cards = self._cards[:-n - 1:-1]
+        del self._cards[-n:]
+        return cards
+
+    def deal_round(self, table, cards_per_seat=1):
+        """ Deals cards_per_seat cards to every occupied seat, one card at a
+            time starting left of the button, as a dealer would. Returns the
+            seats that were dealt to.
+        """
+        seats = dealer.get_players(table)
+        cards = self.deal_many(len(seats) * cards_per_seat)
+        for i, c in enumerate(cards):
+            seats[i % len(seats)].hand.add(c)
+        return seats
+
+    @property
+    def secure(self):
+        """ True if shuffles draw from OS entropy, False if they are seeded. """
+        return self.seed is None
+
+    def snapshot(self):
+        """ Returns a Snapshot of the cards left in the deck as one byte per
+            card id in deal order, with the seed (None for OS entropy) and how
+            many times the deck has been shuffled. The cards themselves stay
+            hidden; the snapshot can be written to an audit.AuditLog.
+        """
+        return Snapshot(self._deal_order(), self.seed, self.shuffles)
+
+    def _deal_order(self):
+        """ Returns the ids of the cards left as bytes, top card first. """
+        return bytes(c.id for c in reversed(self._cards))
+
+    def shuffle(self):
+        """ Shuffles the cards left in the deck with a Fisher-Yates shuffle. """
+        self.shuffles += 1
+        if self.seed is not None:
+            self._rng.shuffle(self._cards)
+            return
+
+        cards, randbelow = self._cards, self._randbelow
+        for i in range(len(cards) - 1, 0, -1):
+            j = randbelow(i + 1)
+            cards[i], cards[j] = cards[j], cards[i]
+
     @property
     def cards(self):
         raise AttributeError('Outside access not allowed to cards in SecureDeck!')
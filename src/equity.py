@@ -0,0 +1,200 @@
+""" Calculates the equity of one poker hand against another by dealing out
+    random runouts of the board.
+"""
+
+import functools
+import itertools
+import math
+import random
+import secrets
+import time
+from collections import namedtuple
+from concurrent.futures import ProcessPoolExecutor
+from fractions import Fraction
+from . import evaluator as ev
+
+BOARDSIZE = 5
+DECKSIZE = 52
+BATCHSIZE = 2000
+Z_95 = 1.96
+EXACT_CACHESIZE = 4096
+SUIT_PERMUTATIONS = tuple(itertools.permutations(range(4)))
+
+Equity = namedtuple('Equity', ['win', 'tie', 'loss', 'equity', 'stderr', 'ci', 'trials'])
+ExactEquity = namedtuple('ExactEquity', ['win', 'tie', 'loss', 'equity', 'runouts',
+                                         'evaluated', 'elapsed', 'cached'])
+
+
+def to_ids(cards):
+    """ Returns a tuple of card ids for a list of PlayingCards (or ids). """
+    return tuple(c if isinstance(c, int) else c.id for c in cards or ())
+
+
+def check_cards(*groups):
+    """ Raises a ValueError if a card shows up more than once, or isn't one
+        of the 52 standard cards.
+    """
+    ids = [i for g in groups for i in g]
+    if len(set(ids)) != len(ids):
+        raise ValueError('The same card cannot be used twice!')
+    if any(i < 0 or i >= DECKSIZE for i in ids):
+        raise ValueError('Only the 52 standard cards can be used for equity!')
+
+
+def run_trials(hero, villain, board, dead, trials, seed):
+    """ Deals trials random runouts and returns (wins, ties, losses) for hero.
+        Module level so it can be sent to worker processes.
+    """
+    rng = random.Random(seed)
+    known = set(hero + villain + board + dead)
+    stub = [i for i in range(DECKSIZE) if i not in known]
+    need = BOARDSIZE - len(board)
+
+    wins = ties = 0
+    for _ in range(trials):
+        runout = board + tuple(rng.sample(stub, need))
+        hero_val = ev.best_value(hero + runout)
+        villain_val = ev.best_value(villain + runout)
+        if hero_val > villain_val:
+            wins += 1
+        elif hero_val == villain_val:
+            ties += 1
+    return wins, ties, trials - wins - ties
+
+
+def summarize(wins, ties, losses, z=Z_95):
+    """ Turns outcome counts into an Equity with percentages, the standard
+        error of the equity and normal confidence intervals.
+    """
+    n = wins + ties + losses
+    if n == 0:
+        raise ValueError('Cannot summarize 0 trials!')
+
+    eq = (wins + ties / 2) / n
+    # Each trial scores 1, 0.5 or 0, so the mean square is (wins + ties / 4) / n
+    variance = max((wins + ties / 4) / n - eq ** 2, 0)
+    stderr = math.sqrt(variance / n)
+
+    ci = {}
+    for name, p in (('win', wins / n), ('tie', ties / n), ('loss', losses / n)):
+        margin = z * math.sqrt(p * (1 - p) / n)
+        ci[name] = (100 * max(p - margin, 0), 100 * min(p + margin, 1))
+    ci['equity'] = (100 * max(eq - z * stderr, 0), 100 * min(eq + z * stderr, 1))
+
+    return Equity(win=100 * wins / n, tie=100 * ties / n, loss=100 * losses / n,
+                  equity=100 * eq, stderr=100 * stderr, ci=ci, trials=n)
+
+
+def equity(hero, villain, board=None, dead=None, trials=10000, workers=1,
+           seed=None, target_stderr=None, batchsize=BATCHSIZE):
+    """ Estimates hero's equity against villain by dealing trials random
+        runouts. Returns an Equity of win/tie/loss percentages.
+
+        Trials are dealt in batches that are each seeded from seed and their
+        batch number, so the same seed gives the same result for any number
+        of workers. With target_stderr set (in percent), dealing stops once
+        the standard error of the equity drops below it.
+    """
+    hero, villain, board, dead = to_ids(hero), to_ids(villain), to_ids(board), to_ids(dead)
+    check_cards(hero, villain, board, dead)
+    if len(board) > BOARDSIZE:
+        raise ValueError('The board cannot have more than {} cards!'.format(BOARDSIZE))
+    if trials < 1:
+        raise ValueError('Need at least 1 trial!')
+    if seed is None:
+        seed = secrets.randbits(64)
+
+    sizes = [min(batchsize, trials - start) for start in range(0, trials, batchsize)]
+    jobs = [(hero, villain, board, dead, size, '{}:{}'.format(seed, i)) for i, size in enumerate(sizes)]
+
+    if workers > 1:
+        with ProcessPoolExecutor(max_workers=workers) as executor:
+            results = executor.map(run_trials, *zip(*jobs))
+            totals = collect(results, target_stderr)
+            executor.shutdown(cancel_futures=True)
+    else:
+        totals = collect((run_trials(*j) for j in jobs), target_stderr)
+    return summarize(*totals)
+
+
+def collect(results, target_stderr=None):
+    """ Adds up batches of (wins, ties, losses) in order, stopping early once
+        the standard error is below target_stderr.
+    """
+    totals = [0, 0, 0]
+    for result in results:
+        totals = [t + r for t, r in zip(totals, result)]
+        if target_stderr is not None and summarize(*totals).stderr < target_stderr:
+            break
+    return totals
+
+
+def exact_equity(hero, villain, board=None, dead=None):
+    """ Works out hero's exact equity against villain by dealing every
+        possible completion of the board. Returns an ExactEquity with the
+        win/tie/loss and equity as Fractions, how many runouts there were, how
+        many were actually evaluated after collapsing suit-isomorphic runouts,
+        the elapsed seconds and whether the result came from the cache.
+    """
+    start = time.perf_counter()
+    hero, villain, board, dead = to_ids(hero), to_ids(villain), to_ids(board), to_ids(dead)
+    check_cards(hero, villain, board, dead)
+    if len(board) > BOARDSIZE:
+        raise ValueError('The board cannot have more than {} cards!'.format(BOARDSIZE))
+
+    key = canonical_form(hero, villain, board, dead)
+    misses = enumerate_runouts.cache_info().misses
+    wins, ties, losses, evaluated = enumerate_runouts(*key)
+    cached = enumerate_runouts.cache_info().misses == misses
+
+    total = wins + ties + losses
+    return ExactEquity(win=Fraction(wins, total), tie=Fraction(ties, total),
+                       loss=Fraction(losses, total), equity=Fraction(2 * wins + ties, 2 * total),
+                       runouts=total, evaluated=evaluated,
+                       elapsed=time.perf_counter() - start, cached=cached)
+
+
+def permute_suits(ids, perm):
+    """ Returns the sorted card ids after swapping suits by the permutation. """
+    return tuple(sorted(13 * perm[i // 13] + i % 13 for i in ids))
+
+
+def canonical_form(*groups):
+    """ Returns the smallest suit permutation of the groups of card ids. Hands
+        that only differ by suits, like AsKs vs AhKh, share a canonical form.
+    """
+    return min(tuple(permute_suits(g, p) for g in groups) for p in SUIT_PERMUTATIONS)
+
+
+@functools.lru_cache(maxsize=EXACT_CACHESIZE)
+def enumerate_runouts(hero, villain, board, dead):
+    """ Deals every completion of the board and returns (wins, ties, losses,
+        evaluated). Runouts are grouped by the suit permutations that leave
+        all the known cards unchanged: only the smallest runout of each group
+        is evaluated and it counts once for every runout in its group.
+    """
+    groups = (hero, villain, board, dead)
+    symmetries = [p for p in SUIT_PERMUTATIONS
+                  if all(permute_suits(g, p) == g for g in groups)]
+    known = set(hero + villain + board + dead)
+    stub = [i for i in range(DECKSIZE) if i not in known]
+
+    wins = ties = losses = evaluated = 0
+    for runout in itertools.combinations(stub, BOARDSIZE - len(board)):
+        weight = 1
+        if len(symmetries) > 1:
+            images = {permute_suits(runout, p) for p in symmetries}
+            if runout != min(images):
+                continue
+            weight = len(images)
+
+        evaluated += 1
+        hero_val = ev.best_value(hero + board + runout)
+        villain_val = ev.best_value(villain + board + runout)
+        if hero_val > villain_val:
+            wins += weight
+        elif hero_val == villain_val:
+            ties += weight
+        else:
+            losses += weight
+    return wins, ties, losses, evaluated
@@ -0,0 +1,127 @@
+""" Calculates the equity of one hand range against another with NumPy.
+
+    Every runout of the board is valued once for each combo in either range,
+    then every hero combo is scored against every villain combo at once.
+    Combos that share a card with each other or with the runout are left out
+    of that cell for that runout.
+"""
+
+import itertools
+import math
+import random
+import secrets
+from collections import namedtuple
+from concurrent.futures import ProcessPoolExecutor
+import numpy as np
+from . import equity as eq
+from . import evaluator_batch as eb
+from . import preflop
+from . import ranges
+
+BATCHSIZE = 200
+
+RangeEquity = namedtuple('RangeEquity', ['equity', 'matrix', 'hero', 'villain', 'runouts'])
+
+
+def to_range(hand_range):
+    """ Returns a Range, parsing it first if it is written out as text. """
+    if isinstance(hand_range, str):
+        return ranges.parse(hand_range)
+    return hand_range
+
+
+def combo_bits(combos):
+    """ Returns a uint64 array with the card id bitmask of each combo. """
+    return np.array([(1 << a) | (1 << b) for a, b in combos], dtype=np.uint64).reshape(-1)
+
+
+def score_runouts(hero, villain, board, runouts):
+    """ Values every runout for the combos of both ranges and returns the
+        (scores, counts) matrices: hero's wins plus half its ties against each
+        villain combo, and how many runouts each pair was dealt. Module level
+        so it can be sent to worker processes.
+    """
+    combos = sorted(set(hero) | set(villain))
+    column = {c: i for i, c in enumerate(combos)}
+    heroes = np.array([column[c] for c in hero], dtype=np.int64)
+    villains = np.array([column[c] for c in villain], dtype=np.int64)
+    bits = combo_bits(combos)
+
+    runouts = np.array(runouts, dtype=np.int64).reshape(len(runouts), -1)
+    runout_bits = np.bitwise_or.reduce(np.left_shift(np.uint64(1), runouts.astype(np.uint64)), axis=1)
+    live = (bits[None, :] & runout_bits[:, None]) == 0
+
+    # Only the combos that miss a runout are valued with it.
+    cards = np.hstack([np.tile(np.array(board, dtype=np.int64), (len(runouts), 1)), runouts])
+    runout_index, combo_index = np.nonzero(live)
+    values = np.full(live.shape, -1, dtype=np.int64)
+    values[runout_index, combo_index] = eb.evaluate(
+        np.hstack([np.array(combos, dtype=np.int64)[combo_index], cards[runout_index]]))
+    apart = (bits[heroes][:, None] & bits[villains][None, :]) == 0
+
+    scores = np.zeros((len(hero), len(villain)))
+    counts = np.zeros((len(hero), len(villain)), dtype=np.int64)
+    for i in range(len(runouts)):
+        valid = apart & live[i, heroes][:, None] & live[i, villains][None, :]
+        hero_val, villain_val = values[i, heroes][:, None], values[i, villains][None, :]
+        scores += np.where(valid, (hero_val > villain_val) + 0.5 * (hero_val == villain_val), 0)
+        counts += valid
+    return scores, counts
+
+
+def range_equity(hero, villain, board=None, dead=None, trials=1000, workers=1, seed=None,
+                 batchsize=BATCHSIZE):
+    """ Works out the equity of every hero combo against every villain combo.
+        Ranges can be Ranges or text like 'TT+,AKs'. If there are no more than
+        trials possible runouts they are all dealt, otherwise trials random
+        runouts are.
+
+        Returns a RangeEquity: hero's overall equity weighted by the combo
+        weights, a matrix of each hero combo's equity against each villain
+        combo (NaN where they share a card), the hero and villain combos
+        labelling its rows and columns, and how many runouts were dealt. All
+        equities are percentages.
+    """
+    board, dead = eq.to_ids(board), eq.to_ids(dead)
+    eq.check_cards(board, dead)
+    if len(board) > eq.BOARDSIZE:
+        raise ValueError('The board cannot have more than {} cards!'.format(eq.BOARDSIZE))
+    if trials < 1:
+        raise ValueError('Need at least 1 trial!')
+
+    hero_range, villain_range = to_range(hero), to_range(villain)
+    hero = list(hero_range.combos(board + dead))
+    villain = list(villain_range.combos(board + dead))
+    if not hero or not villain:
+        raise ValueError('Every combo in a range is blocked by the board or dead cards!')
+
+    known = set(board + dead)
+    stub = [i for i in range(eq.DECKSIZE) if i not in known]
+    need = eq.BOARDSIZE - len(board)
+    if math.comb(len(stub), need) <= trials:
+        runouts = list(itertools.combinations(stub, need))
+    else:
+        rng = random.Random(secrets.randbits(64) if seed is None else seed)
+        runouts = [tuple(rng.sample(stub, need)) for _ in range(trials)]
+
+    batches = [runouts[i:i + batchsize] for i in range(0, len(runouts), batchsize)]
+    jobs = [(hero, villain, board, b) for b in batches]
+    if workers > 1:
+        with ProcessPoolExecutor(max_workers=workers) as executor:
+            results = list(executor.map(score_runouts, *zip(*jobs)))
+    else:
+        results = [score_runouts(*j) for j in jobs]
+
+    scores = sum(r[0] for r in results)
+    counts = sum(r[1] for r in results)
+    with np.errstate(invalid='ignore', divide='ignore'):
+        matrix = 100 * scores / counts
+    matrix[counts == 0] = np.nan
+
+    weights = np.outer([hero_range.weights[preflop.combo_index(c)] for c in hero],
+                       [villain_range.weights[preflop.combo_index(c)] for c in villain])
+    weights[counts == 0] = 0
+    if not weights.any():
+        raise ValueError('Every hero combo shares a card with every villain combo!')
+    overall = float((np.nan_to_num(matrix) * weights).sum() / weights.sum())
+    return RangeEquity(equity=overall, matrix=matrix, hero=hero, villain=villain, runouts=len(runouts))
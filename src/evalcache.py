@@ -0,0 +1,138 @@
+""" An opt-in cache in front of evaluator.get_value and find_best_hand.
+
+    Hands are keyed by the bitmask of their card ids, so the same cards in any
+    order share an entry. Values and best hands live in one bounded LRU; a
+    best hand is stored as the mask of its card ids under the hand's key with
+    HAND_KEY set. Caches can be saved to and pre-warmed from a binary file,
+    and pickle as just their settings so process pool workers load the file
+    rather than receiving every entry.
+"""
+
+import os
+import struct
+import threading
+from collections import namedtuple, OrderedDict
+from . import evaluator as ev
+from . import playingcard as pc
+
+MAXSIZE = 100000
+MAGIC = b'EVCH'
+VERSION = 1
+HEADER = struct.Struct('<4sHI')  # magic, version, entries
+ENTRY = struct.Struct('<Qq')  # key, value or best hand mask
+HAND_KEY = 1 << pc.JOKER_ID
+
+CacheInfo = namedtuple('CacheInfo', ['hits', 'misses', 'maxsize', 'currsize'])
+
+
+def hand_key(cards):
+    """ Returns the bitmask of the card ids, or None if the cards can't be
+        told apart by id (jokers or the same card twice).
+    """
+    key = 0
+    for c in cards:
+        key |= 1 << c.id
+    if key >= HAND_KEY or bin(key).count('1') != len(cards):
+        return None
+    return key
+
+
+class EvalCache(object):
+    """ A thread-safe LRU cache of hand values and best hands. """
+    def __init__(self, maxsize=MAXSIZE, path=None):
+        if maxsize < 1:
+            raise ValueError('The cache needs room for at least 1 entry!')
+        self.maxsize = maxsize
+        self.path = path
+        self.hits = self.misses = 0
+        self._data = OrderedDict()
+        self._lock = threading.Lock()
+        if path and os.path.exists(path):
+            self.load(path)
+
+    def __len__(self):
+        return len(self._data)
+
+    def __reduce__(self):
+        """ Pickles only the settings, so an unpickled cache starts over from
+            its file (if it has one).
+        """
+        return self.__class__, (self.maxsize, self.path)
+
+    def info(self):
+        """ Returns a CacheInfo of the hit and miss counts and sizes. """
+        return CacheInfo(self.hits, self.misses, self.maxsize, len(self._data))
+
+    def clear(self):
+        """ Drops every entry and resets the counters. """
+        with self._lock:
+            self._data.clear()
+            self.hits = self.misses = 0
+
+    def get_value(self, cards):
+        """ Returns evaluator.get_value(cards), from the cache if possible. """
+        key = hand_key(cards)
+        if key is None:
+            return ev.get_value(cards)
+        return self._lookup(key, lambda: ev.get_value(cards))
+
+    def find_best_hand(self, cards):
+        """ Returns the best 5 cards, as evaluator.find_best_hand(cards,
+            fast=True) picks them, in the order they were passed.
+        """
+        key = hand_key(cards)
+        if key is None or len(cards) < ev.HANDSIZE:
+            return ev.find_best_hand(cards, fast=True)
+
+        best = self._lookup(key | HAND_KEY, lambda: hand_key(ev.find_best_hand(cards, fast=True)))
+        return tuple(c for c in cards if best >> c.id & 1)
+
+    def _lookup(self, key, compute):
+        """ Returns the entry for key, computing and storing it on a miss. """
+        with self._lock:
+            if key in self._data:
+                self.hits += 1
+                self._data.move_to_end(key)
+                return self._data[key]
+            self.misses += 1
+
+        result = compute()
+        self._store(key, result)
+        return result
+
+    def _store(self, key, result):
+        with self._lock:
+            self._data[key] = result
+            self._data.move_to_end(key)
+            while len(self._data) > self.maxsize:
+                self._data.popitem(last=False)
+
+    def save(self, path=None):
+        """ Writes the entries to a binary file, least recently used first. """
+        path = path or self.path
+        with self._lock:
+            entries = list(self._data.items())
+        with open(path, 'wb') as f:
+            f.write(HEADER.pack(MAGIC, VERSION, len(entries)))
+            for key, result in entries:
+                f.write(ENTRY.pack(key, result))
+
+    def load(self, path=None):
+        """ Pre-warms the cache from a file written by save(). Returns how many
+            entries were read.
+        """
+        path = path or self.path
+        with open(path, 'rb') as f:
+            data = f.read()
+
+        magic, version, count = HEADER.unpack_from(data)
+        if magic != MAGIC:
+            raise ValueError('Not an evaluator cache file!')
+        if version != VERSION:
+            raise ValueError('Evaluator cache version {} is not supported!'.format(version))
+        if len(data) != HEADER.size + count * ENTRY.size:
+            raise ValueError('Evaluator cache file is truncated!')
+
+        for key, result in ENTRY.iter_unpack(data[HEADER.size:]):
+            self._store(key, result)
+        return count
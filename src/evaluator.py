@@ -1,5 +1,6 @@
 """ Evaluates poker hands """
 
+import functools
 import itertools
 from . import playingcard as pc
 from collections import namedtuple
@@ -9,6 +10,28 @@ HANDSIZE = 5
 MULTIPLIERS = (100000000, 1000000, 10000, 100, 1)
 FIVEHIGH, ACEHIGH = 5, 14
 
+# Cactus-Kev style card codes: bits 0-7 hold the rank prime, 8-11 the rank index,
+# 12-15 the suit bit and 16-28 a single rank bit. Products of primes identify
+# rank multisets.
+PRIMES = (2, 3, 5, 7, 11, 13, 17, 19, 23, 29, 31, 37, 41)
+RANKCHARS = tuple(r for r in sorted(pc.RANKS, key=pc.RANKS.get) if r != pc.joker_rank)
+# Indexed by PlayingCard.id
+CARDCODES = [PRIMES[i] | (i << 8) | (1 << (12 + s)) | (1 << (16 + i))
+             for s in range(len(pc.SUITS)) for i in range(len(RANKCHARS))]
+
+# The straights as (rankmask, high card value), highest first. The wheel is last.
+WHEEL = 0x100F
+STRAIGHTS = tuple((0x1F << i, i + 6) for i in range(8, -1, -1)) + ((WHEEL, FIVEHIGH),)
+# The rankmask of the straight with each high card value, 0 for none.
+STRAIGHT_MASKS = {high: m for m, high in STRAIGHTS + ((0, 0),)}
+# One card in dominant_suit's per-suit score, above the rank bits (jokers included).
+SUITCOUNT = 1 << 16
+# Every card id of each rank index, as a 52 bit mask.
+RANKCARDS = tuple(sum(1 << (13 * s + r) for s in range(len(pc.SUITS))) for r in range(len(RANKCHARS)))
+
+Ranklist = namedtuple('Ranklist', ['qty', 'rank'])
+Draw = namedtuple('Draw', ['type', 'outs'])
+
 HANDTYPES = {
     'ROYAL FLUSH':      100000000000,
     'STRAIGHT FLUSH':   90000000000,
@@ -23,6 +46,13 @@ HANDTYPES = {
     'INVALID': -1
 }
 
+# Every hand type is a multiple of BASEVALUE, so the type of a value is its
+# quotient. RANKNAMES turns the rank digits of a value back into ranks.
+BASEVALUE = 10000000000
+TYPENAMES = {v // BASEVALUE: k for k, v in HANDTYPES.items() if v >= 0}
+RANKNAMES = {v: k for k, v in pc.RANKS.items()}
+DESCRIPTION_CACHESIZE = 8192
+
 DRAWTYPES = {
     'STRAIGHT FLUSH DRAW': 5000,
     'FLUSH DRAW': 4000,
@@ -37,37 +67,54 @@ DRAWTYPES = {
 
 
 def is_wheel(cards):
-    """ Check if the group of cards(passed as a rank dictionary) counts as a 'wheel
-        straight, or A2345.
+    """ Check if the ranks of the cards are exactly A2345, a 'wheel' straight. """
+    return rank_mask(cards) == WHEEL
+
+
+def rank_mask(cards):
+    """ Returns the 13 bit mask of the ranks in a list of cards, 2 being the
+        lowest bit. Jokers are left out.
+    """
+    mask = 0
+    for c in cards:
+        mask |= c.rankbit
+    return mask & 0x1FFF
+
+
+def batch(ids):
+    """ Values a 2D array of card ids, one hand per row, with the NumPy batch
+        evaluator. Returns an int64 array of values.
     """
-    return set(rank_dict(cards).keys()) == {'A', '2', '3', '4', '5'}
+    from . import evaluator_batch
+    return evaluator_batch.evaluate(ids)
 
 
 def dominant_suit(cards):
     """ Finds which suit occurs with the greatest frequency in a list of Cards.
         If there are an equal # of suits between cards, count the higher ranked
         cards.  If a tie is further needed to be broken because the suited cards
-        are the same rank, break the tie by using the traditional ranking of suits.
-    """
-    suitdict = suitedcard_dict(cards)
-    domcount = max(len(s) for s in suitdict.values())
+        are the same rank, the suit that shows up first wins.
 
-    # Count how many ties there are.
-    tied = [s for s in suitdict if len(suitdict[s]) == domcount]
+        Each suit is scored in one pass as its count above a mask of its ranks,
+        so comparing scores compares the counts and then the ranks from the top.
+        A mask can't hold the same rank twice, so if a suit repeats a rank (as
+        cards from a multi-deck shoe can) the tied suits are compared card by
+        card instead.
+    """
+    if not cards:
+        raise ValueError('Cannot find the dominant suit of 0 cards!')
 
-    if len(tied) == 1:
-        return tied.pop()
-    else:
-        # We have to find the more dominant suit by comparing ranks
-        highscore = 0
-        highsuit = None
+    scores, repeats = {}, False
+    for c in cards:
+        score = scores.get(c.suit, 0)
+        repeats = repeats or bool(score & c.rankbit)
+        scores[c.suit] = score + SUITCOUNT | c.rankbit
+    if not repeats:
+        return max(scores, key=scores.get)
 
-        for s in tied:
-            score = score_cardlist(suitdict[s])
-            if score > highscore:
-                highscore = score
-                highsuit = s
-        return highsuit
+    top = max(scores.values()) // SUITCOUNT
+    tied = [s for s in scores if scores[s] // SUITCOUNT == top]
+    return max(tied, key=lambda s: score_cardlist([c for c in cards if c.suit == s]))
 
 
 def is_set(cards):
@@ -77,18 +124,10 @@ def is_set(cards):
 
 
 def is_straight(cards):
-    """ Check the list of cards to see if it is a valid straight. If it is,
-        returns the highest rank in straight, otherwise returns -1.
+    """ Check the list of cards (any number of them) for a straight. If there
+        is one, returns the highest rank in the best straight, otherwise 0.
     """
-    if not is_validhand(cards):
-        return 0
-    elif get_allgaps(cards) == 0:
-        return max(cards).val()
-
-    for c, r in zip(sorted(cards), [2, 3, 4, 5, 14]):
-        if c.val() != r:
-            return 0
-    return 5
+    return STRAIGHT_HIGHS[rank_mask(cards)]
 
 
 def is_suited(cards):
@@ -101,12 +140,15 @@ def is_validhand(cards):
     return len(set(cards)) == 5
 
 
-def find_best_hand(cards):
+def find_best_hand(cards, fast=False):
     """ Takes a list of cards and determines the best available 5 card hand and
-        returns that hand as a Hand.
+        returns that hand as a Hand. With fast set, the hand is picked by
+        find_best_hand_fast instead of scoring every 5 card combination.
     """
     if len(cards) < HANDSIZE:
         return None
+    elif fast:
+        return find_best_hand_fast(cards)[1]
     combos = [c for c in itertools.combinations(cards, HANDSIZE)]
 
     bestcombo, bestvalue = None, 0
@@ -118,6 +160,134 @@ def find_best_hand(cards):
     return bestcombo
 
 
+def find_best_hand_fast(cards):
+    """ Determines the best 5 card hand without trying every combination and
+        returns a (value, hand) tuple. Returns None for less than 5 cards.
+    """
+    if len(cards) < HANDSIZE:
+        return None
+    try:
+        codes = [CARDCODES[c.id] for c in cards]
+    except IndexError:
+        besthand = find_best_hand(cards)
+        return get_value(besthand), besthand
+
+    besthand = tuple(cards[i] for i in best_positions(codes))
+    return get_value(besthand), besthand
+
+
+def best_positions(codes):
+    """ Walks the rank counts and suit groups of a list of card codes, from the
+        best hand type down, and returns the positions of the best 5 cards.
+    """
+    byrank, bysuit = {}, {}
+    for i, c in enumerate(codes):
+        byrank.setdefault(c >> 8 & 0xF, []).append(i)
+        bysuit.setdefault(c & 0xF000, []).append(i)
+
+    flushes = [sorted(s, key=lambda i: -codes[i]) for s in bysuit.values() if len(s) >= HANDSIZE]
+    ranks = sorted(byrank, reverse=True)
+    sets = [r for r in ranks if len(byrank[r]) >= 3]
+    pairs = [r for r in ranks if len(byrank[r]) >= 2]
+
+    def kickers(exclude, qty):
+        return [byrank[r][0] for r in ranks if r not in exclude][:qty]
+
+    # Straight flushes
+    best = None
+    for suited in flushes:
+        bysuitrank = {codes[i] >> 8 & 0xF: i for i in reversed(suited)}
+        high, m = find_straight(sum(1 << r for r in bysuitrank))
+        if high and (best is None or high > best[0]):
+            best = high, [bysuitrank[r] for r in sorted(bysuitrank, reverse=True) if m >> r & 1]
+    if best:
+        return best[1]
+
+    # Quads, then full houses
+    for r in ranks:
+        if len(byrank[r]) >= 4:
+            return byrank[r][:4] + kickers([r], 1)
+    if sets and len(pairs) > 1:
+        pair = next(r for r in pairs if r != sets[0])
+        return byrank[sets[0]][:3] + byrank[pair][:2]
+
+    # Flushes, the highest one if there are several suits to choose from.
+    if flushes:
+        return max((s[:HANDSIZE] for s in flushes), key=lambda h: [codes[i] >> 16 for i in h])
+
+    high, m = find_straight(sum(1 << r for r in ranks))
+    if high:
+        return [byrank[r][0] for r in ranks if m >> r & 1]
+
+    if sets:
+        return byrank[sets[0]][:3] + kickers(sets[:1], 2)
+    elif len(pairs) > 1:
+        return byrank[pairs[0]][:2] + byrank[pairs[1]][:2] + kickers(pairs[:2], 1)
+    elif pairs:
+        return byrank[pairs[0]][:2] + kickers(pairs, 3)
+    return kickers([], HANDSIZE)
+
+
+def find_straight(mask):
+    """ Looks for the highest straight in a 13 bit rankmask. Returns a tuple of
+        the high card value and the straight's rankmask, or (0, 0) for none.
+    """
+    high = STRAIGHT_HIGHS[mask]
+    return high, STRAIGHT_MASKS[high]
+
+
+def get_draw(cards):
+    """ Classifies the best draw in a partial hand by its DRAWTYPES entry and
+        counts the outs: the unseen cards that would complete a flush or a
+        straight with one more card. Backdoor and 2 card draws have no outs.
+        Returns a Draw(type, outs).
+    """
+    suitmasks = [0] * len(pc.SUITS)
+    for c in cards:
+        if c.id < len(CARDCODES):
+            suitmasks[c.id // 13] |= 1 << (c.id % 13)
+    rankmask = suitmasks[0] | suitmasks[1] | suitmasks[2] | suitmasks[3]
+
+    best, outs = 'HIGH CARD DRAW', 0
+    suitcounts = [bin(m).count('1') for m in suitmasks]
+    if max(suitcounts) < HANDSIZE:
+        for s, m in enumerate(suitmasks):
+            if suitcounts[s] == 4:
+                outs |= (~m & 0x1FFF) << (13 * s)
+                best = 'STRAIGHT FLUSH DRAW' if STRAIGHT_DRAWS[m] else 'FLUSH DRAW'
+            elif suitcounts[s] == 3:
+                best = better_draw(best, 'BACKDOOR FLUSH DRAW')
+            elif suitcounts[s] == 2:
+                best = better_draw(best, '2 SUITED DRAW')
+
+    if not STRAIGHT_HIGHS[rankmask]:
+        completing = STRAIGHT_DRAWS[rankmask]
+        for r in range(len(RANKCHARS)):
+            if completing >> r & 1:
+                outs |= RANKCARDS[r]
+
+        if completing & (completing - 1):
+            best = better_draw(best, 'STRAIGHT DRAW')
+        elif completing:
+            best = better_draw(best, 'GUTSHOT DRAW')
+        elif BACKDOOR_STRAIGHTS[rankmask]:
+            best = better_draw(best, 'BACKDOOR STRAIGHT DRAW')
+        elif rankmask & (rankmask >> 1 | rankmask << 12 & 0x1000):
+            best = better_draw(best, '2 CONNECTED DRAW')
+
+    return Draw(type=best, outs=bin(outs).count('1'))
+
+
+def get_draws(hands):
+    """ Classifies the draws of a batch of hands. Returns a list of Draws. """
+    return [get_draw(h) for h in hands]
+
+
+def better_draw(draw1, draw2):
+    """ Returns whichever draw type is worth more in DRAWTYPES. """
+    return draw1 if DRAWTYPES[draw1] >= DRAWTYPES[draw2] else draw2
+
+
 def get_allgaps(cards):
     """ Takes a list of cards and determines how many gaps are between all the
         ranks (when they occur in sorted order. Should work regardless of order.)
@@ -147,40 +317,43 @@ def get_gap(card1, card2):
 
 def get_description(value, cards):
     """ Returns a text description of the passed pokerhand. """
-    ranks = rank_list(cards)
-    RANK = get_type(value)
-    BASEVALUE = 10000000000
-
     if len(cards) == 0:
         return 'No cards!'
-    elif RANK in ['STRAIGHT', 'STRAIGHT FLUSH']:
-        if value % BASEVALUE == 0:
-            return '5 High'
-        else:
-            return '{} High'.format(ranks[0].rank)
-    elif RANK in ['QUADS', 'TRIPS', 'PAIR']:
-        return '{}\'s'.format(ranks[0].rank)
+    elif value < 0:
+        return '{} High'.format(rank_list(cards)[0].rank)
+    return describe_value(value)
+
+
+@functools.lru_cache(maxsize=DESCRIPTION_CACHESIZE)
+def describe_value(value):
+    """ Returns the text description of a hand value. The ranks that matter
+        for the description are the top digits of the value.
+    """
+    RANK = get_type(value)
+    if RANK == 'ROYAL FLUSH':
+        return 'A High'
+    elif RANK in ['STRAIGHT', 'STRAIGHT FLUSH'] and value % BASEVALUE == 0:
+        return '5 High'
+
+    first = RANKNAMES[value % BASEVALUE // MULTIPLIERS[0]]
+    if RANK in ['QUADS', 'TRIPS', 'PAIR']:
+        return '{}\'s'.format(first)
     elif RANK == 'FULL HOUSE':
-        return '{}\'s full of {}\'s'.format(
-            ranks[0].rank, ranks[1].rank)
+        return '{}\'s full of {}\'s'.format(first, RANKNAMES[value % MULTIPLIERS[0] // MULTIPLIERS[1]])
     elif RANK == 'TWO PAIR':
-        return '{}\'s and {}\'s'.format(
-            ranks[0].rank, ranks[1].rank)
+        return '{}\'s and {}\'s'.format(first, RANKNAMES[value % MULTIPLIERS[0] // MULTIPLIERS[1]])
     else:
-        return '{} High'.format(ranks[0].rank)
+        return '{} High'.format(first)
 
 
 def get_type(value):
     """ Determine the type of hand given the numerical value. """
     if value < 0:
         return 'INVALID'
-    else:
-        roundedval = round(value, -10)
-
-    for v in HANDTYPES:
-        if HANDTYPES[v] == roundedval:
-            return v
-    raise ValueError('Type error: Cannot find type!')
+    try:
+        return TYPENAMES[value // BASEVALUE]
+    except KeyError:
+        raise ValueError('Type error: Cannot find type!')
 
 
 def get_value(cards):
@@ -189,6 +362,54 @@ def get_value(cards):
         still calculate what type of hand it is("pair", "two pair", etc), but
         having less than 5 cards automatically filters out the hands that require
         5: straights, flushes, full house, etc.
+
+        Hands of up to 5 cards are looked up in the precomputed tables, anything
+        else (jokers, more than 5 cards) is scored by score_hand.
+    """
+    if len(cards) > HANDSIZE:
+        return score_hand(cards)
+    try:
+        value = lookup_value([CARDCODES[c.id] for c in cards])
+    except IndexError:
+        value = None
+
+    if value is None:
+        return score_hand(cards)
+    return value
+
+
+def lookup_value(codes):
+    """ Looks up the value of up to 5 card codes in the precomputed tables.
+        Returns None if the codes aren't in the tables.
+    """
+    if len(codes) == HANDSIZE:
+        c1, c2, c3, c4, c5 = codes
+        mask = (c1 | c2 | c3 | c4 | c5) >> 16
+        if c1 & c2 & c3 & c4 & c5 & 0xF000:
+            value = FLUSHES[mask]
+        else:
+            value = UNIQUE5[mask]
+        if value:
+            return value
+
+    product = 1
+    for c in codes:
+        product *= c & 0xFF
+    return PRODUCTS.get(product)
+
+
+def best_value(ids):
+    """ Returns the value of the best 5 card hand in a list of 5 or more card
+        ids. This skips the card objects entirely, for simulations.
+    """
+    codes = [CARDCODES[i] for i in ids]
+    return lookup_value([codes[i] for i in best_positions(codes)])
+
+
+def score_hand(cards):
+    """ Calculates the value of a list of cards by building and scoring its
+        ranklist. This is the reference scoring that the lookup tables are
+        built to match.
     """
     ranklist = rank_list(sorted(cards))
 
@@ -213,7 +434,6 @@ def rank_list(cards):
     """ Returns a list of quantity/rank pairs by making a rank dictionary,
         converting it to a list and sorting it by rank.
     """
-    Ranklist = namedtuple('Ranklist', ['qty', 'rank'])
     ranks = rank_dict(cards)
     L = [Ranklist(qty=ranks[r], rank=r) for r in ranks]
     return sorted(L, key=lambda x: (-x.qty, -pc.RANKS[x.rank]))
@@ -279,9 +499,18 @@ def score_pair_hands(cards, ranklist):
 
 
 def score_nonpair_hands(cards, ranklist):
-    straight_chk = is_straight(cards)
+    """ Scores 5 unique ranks. Only a list of exactly 5 cards can make a
+        straight; longer lists keep the scoring they have always had.
+    """
+    straight = is_straight(cards) if len(cards) == HANDSIZE else 0
+    return score_unique_hands(straight, is_suited(cards), ranklist)
 
-    if is_suited(cards):
+
+def score_unique_hands(straight_chk, suited, ranklist):
+    """ Calculates the value of 5 unique ranks given the high card of the
+        straight they make (0 for none) and whether they are all one suit.
+    """
+    if suited:
         if straight_chk == ACEHIGH:
             return HANDTYPES['ROYAL FLUSH']
         elif straight_chk == FIVEHIGH:
@@ -303,3 +532,69 @@ def score_ranklist(ranklist):
         Precondition: Hand should be ordered by highest value first, lowest last
     """
     return sum(pc.RANKS[c[1]] * MULTIPLIERS[i] for i, c in enumerate(ranklist))
+
+
+def build_tables():
+    """ Precomputes the lookup tables used by get_value. Every rank multiset of
+        up to 5 cards is scored once: 5 unique ranks are indexed by their 13 bit
+        rankmask (suited and unsuited), everything else by its prime product.
+    """
+    flushes, unique5, products = [0] * 0x2000, [0] * 0x2000, {}
+    straights = dict(STRAIGHTS)
+
+    for size in range(1, HANDSIZE + 1):
+        for combo in itertools.combinations_with_replacement(range(len(RANKCHARS)), size):
+            counts = defaultdict(int)
+            for i in combo:
+                counts[i] += 1
+            if max(counts.values()) > 4:
+                continue
+
+            ranklist = sorted((Ranklist(qty=q, rank=RANKCHARS[i]) for i, q in counts.items()),
+                              key=lambda x: (-x.qty, -pc.RANKS[x.rank]))
+
+            if len(counts) == HANDSIZE:
+                mask = sum(1 << i for i in combo)
+                straight = straights.get(mask, 0)
+                flushes[mask] = score_unique_hands(straight, True, ranklist)
+                unique5[mask] = score_unique_hands(straight, False, ranklist)
+            else:
+                product = 1
+                for i in combo:
+                    product *= PRIMES[i]
+                products[product] = score_pair_hands(None, ranklist)
+
+    return flushes, unique5, products
+
+
+def build_straight_table():
+    """ Returns the high card value of the best straight in every 13 bit
+        rankmask, or 0 if it has none.
+    """
+    table = [0] * 0x2000
+    for m, high in reversed(STRAIGHTS):
+        for mask in range(0x2000):
+            if mask & m == m:
+                table[mask] = high
+    return table
+
+
+def build_draw_tables():
+    """ Precomputes, for every 13 bit rankmask, the mask of ranks that would
+        complete a straight and whether 3 ranks of any straight are there.
+        Both use the same straight windows as the evaluator.
+    """
+    draws, backdoors = [0] * 0x2000, [False] * 0x2000
+    for mask in range(0x2000):
+        for m, high in STRAIGHTS:
+            missing = m & ~mask
+            if missing and not missing & (missing - 1):
+                draws[mask] |= missing
+            elif bin(m & mask).count('1') >= 3:
+                backdoors[mask] = True
+    return draws, backdoors
+
+
+STRAIGHT_HIGHS = build_straight_table()
+FLUSHES, UNIQUE5, PRODUCTS = build_tables()
+STRAIGHT_DRAWS, BACKDOOR_STRAIGHTS = build_draw_tables()
@@ -0,0 +1,180 @@
+""" Evaluates large arrays of poker hands at once with NumPy.
+
+    Hands are passed as integer arrays of PlayingCard ids, one hand per row.
+    Values match evaluator.get_value for 5 card hands and the value of
+    evaluator.find_best_hand for 6 and 7 card hands.
+"""
+
+import functools
+import itertools
+import time
+import numpy as np
+from . import evaluator as ev
+from . import playingcard as pc
+
+CHUNKSIZE = 65536
+DECKSIZE = 52
+MAXTABLESIZE = 7
+
+PRIMES = np.array(ev.PRIMES, dtype=np.int64)
+FLUSHES = np.array(ev.FLUSHES, dtype=np.int64)
+UNIQUE5 = np.array(ev.UNIQUE5, dtype=np.int64)
+PRODUCT_KEYS = np.array(sorted(ev.PRODUCTS), dtype=np.int64)
+PRODUCT_VALUES = np.array([ev.PRODUCTS[k] for k in sorted(ev.PRODUCTS)], dtype=np.int64)
+
+
+def to_array(hands):
+    """ Converts a list of hands (lists of PlayingCards) to an array of card ids. """
+    return np.array([[c.id for c in h] for h in hands], dtype=np.int64)
+
+
+def evaluate(ids):
+    """ Returns an int64 array with the value of every row of card ids. Rows
+        longer than 5 cards are valued by their best 5 card hand.
+    """
+    ids = np.asarray(ids, dtype=np.int64)
+    if ids.ndim != 2 or ids.shape[1] < 1:
+        raise ValueError('Hands must be passed as a 2D array of card ids!')
+    if ids.size and (ids.min() < 0 or ids.max() >= DECKSIZE):
+        raise ValueError('Card ids must be between 0 and {}!'.format(DECKSIZE - 1))
+
+    size = ids.shape[1]
+    if size <= ev.HANDSIZE:
+        return score_rows(ids)
+    elif size <= MAXTABLESIZE:
+        return score_big_rows(ids)
+
+    combos = np.array(list(itertools.combinations(range(size), ev.HANDSIZE)))
+    values = np.empty(len(ids), dtype=np.int64)
+    step = max(1, CHUNKSIZE // len(combos))
+
+    for start in range(0, len(ids), step):
+        chunk = ids[start:start + step][:, combos].reshape(-1, ev.HANDSIZE)
+        values[start:start + step] = score_rows(chunk).reshape(-1, len(combos)).max(axis=1)
+    return values
+
+
+def score_rows(ids):
+    """ Looks up the values of rows of up to 5 card ids in the evaluator tables. """
+    ranks, suits = ids % 13, ids // 13
+    values = np.zeros(len(ids), dtype=np.int64)
+
+    if ids.shape[1] == ev.HANDSIZE:
+        masks = np.bitwise_or.reduce(np.left_shift(1, ranks), axis=1)
+        suited = (suits == suits[:, :1]).all(axis=1)
+        values = np.where(suited, FLUSHES[masks], UNIQUE5[masks])
+
+    paired = values == 0
+    values[paired] = lookup(PRODUCT_KEYS, PRODUCT_VALUES, PRIMES[ranks[paired]].prod(axis=1))
+    return values
+
+
+def score_big_rows(ids):
+    """ Values rows of 6 or 7 card ids. With that few cards a flush rules out
+        quads and full houses, so flush rows are valued from the suited
+        rankmask and all the others from the multiset of ranks.
+    """
+    ranks, suits = ids % 13, ids // 13
+    keys, vals = multiset_table(ids.shape[1])
+    values = lookup(keys, vals, PRIMES[ranks].prod(axis=1))
+
+    suitcounts = (suits[:, :, None] == np.arange(4)).sum(axis=1)
+    flush = suitcounts.max(axis=1) >= ev.HANDSIZE
+    if flush.any():
+        flushsuit = suitcounts[flush].argmax(axis=1)
+        bits = np.where(suits[flush] == flushsuit[:, None], np.left_shift(1, ranks[flush]), 0)
+        values[flush] = BEST_FLUSHES[np.bitwise_or.reduce(bits, axis=1)]
+    return values
+
+
+def lookup(keys, vals, products):
+    """ Finds the values of prime products in a sorted table of keys. """
+    found = np.searchsorted(keys, products).clip(max=len(keys) - 1)
+    if not (keys[found] == products).all():
+        raise ValueError('Cannot value a hand with 5 cards of the same rank!')
+    return vals[found]
+
+
+def best_flushes():
+    """ Returns the best flush or straight flush value for every 13 bit
+        rankmask of 5 or more suited cards.
+    """
+    table = np.zeros(0x2000, dtype=np.int64)
+    for mask in range(0x2000):
+        if bin(mask).count('1') < ev.HANDSIZE:
+            continue
+        high, m = ev.find_straight(mask)
+        if not high:
+            # Drop the lowest ranks until only the top 5 are left.
+            m = mask
+            while bin(m).count('1') > ev.HANDSIZE:
+                m &= m - 1
+        table[mask] = ev.FLUSHES[m]
+    return table
+
+
+@functools.lru_cache(maxsize=None)
+def multiset_table(size):
+    """ Builds a table of the best non-flush value for every multiset of size
+        ranks, keyed by sorted prime product. Built on first use.
+    """
+    deck = pc.std_deck()
+    products, values = [], []
+    for combo in itertools.combinations_with_replacement(range(len(ev.RANKCHARS)), size):
+        if any(combo.count(r) > 4 for r in set(combo)):
+            continue
+        # Cycling the suits keeps consecutive copies of a rank apart and stops a flush.
+        cards = [deck[13 * (i % 4) + r] for i, r in enumerate(combo)]
+        product = 1
+        for r in combo:
+            product *= ev.PRIMES[r]
+        products.append(product)
+        values.append(ev.find_best_hand_fast(cards)[0])
+
+    order = np.argsort(products)
+    return np.array(products, dtype=np.int64)[order], np.array(values, dtype=np.int64)[order]
+
+
+def random_hands(qty, size, seed=None):
+    """ Returns an array of qty random hands of size distinct card ids. """
+    rng = np.random.default_rng(seed)
+    return np.argsort(rng.random((qty, DECKSIZE)), axis=1)[:, :size]
+
+
+def benchmark(qty=100000, size=5, seed=0, scalar_qty=10000):
+    """ Times evaluate against the scalar evaluator on the same random hands.
+        Returns a dictionary of microseconds per hand for each path.
+    """
+    ids = random_hands(qty, size, seed)
+    deck = pc.std_deck()
+    hands = [[deck[i] for i in row] for row in ids[:scalar_qty].tolist()]
+
+    evaluate(ids[:1])  # Builds any lazy tables outside of the timing.
+    start = time.perf_counter()
+    evaluate(ids)
+    batch = time.perf_counter() - start
+
+    start = time.perf_counter()
+    if size == ev.HANDSIZE:
+        for h in hands:
+            ev.get_value(h)
+    else:
+        for h in hands:
+            ev.find_best_hand_fast(h)
+    scalar = time.perf_counter() - start
+
+    return {
+        'hands': qty,
+        'size': size,
+        'batch_us': batch / qty * 1e6,
+        'scalar_us': scalar / len(hands) * 1e6,
+    }
+
+
+BEST_FLUSHES = best_flushes()
+
+
+if __name__ == "__main__":
+    for size in (5, 6, 7):
+        result = benchmark(size=size)
+        print('{size} cards: batch {batch_us:.3f}us/hand, scalar {scalar_us:.3f}us/hand'.format(**result))
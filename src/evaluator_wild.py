@@ -0,0 +1,94 @@
+""" Evaluates poker hands where Jokers are wild.
+
+    A Joker stands in for whichever card not already in the 5 card hand makes
+    it best. There is no five of a kind, so a Joker can't be a fifth card of a
+    rank. Hands without Jokers are valued exactly as evaluator.get_value does.
+
+    The best completion only depends on the ranks of the other cards, how
+    many Jokers there are and whether the other cards are all one suit, so
+    it is looked up in a table keyed by (prime product of the other ranks,
+    jokers, suited). Entries are worked out the first time they are needed by
+    trying the 13 ranks for each Joker, never the 52 cards.
+"""
+
+import itertools
+from . import evaluator as ev
+from . import playingcard as pc
+
+MAXRANKS = 4
+
+_completions = {}
+
+
+def get_value(cards):
+    """ Returns the value of up to 5 cards with the Jokers wild. """
+    if len(cards) > ev.HANDSIZE:
+        raise ValueError('Use best_value for hands of more than {} cards!'.format(ev.HANDSIZE))
+
+    ids = [c.id for c in cards]
+    jokers = ids.count(pc.JOKER_ID)
+    if not jokers:
+        return ev.get_value(cards)
+
+    product, suits = 1, set()
+    for i in ids:
+        if i != pc.JOKER_ID:
+            product *= ev.PRIMES[i % 13]
+            suits.add(i // 13)
+    suited = len(ids) == ev.HANDSIZE and len(suits) <= 1
+
+    key = (product, jokers, suited)
+    if key not in _completions:
+        ranks = [i % 13 for i in ids if i != pc.JOKER_ID]
+        _completions[key] = best_completion(ranks, jokers, suited)
+    return _completions[key]
+
+
+def best_completion(ranks, jokers, suited):
+    """ Returns the best value of the rank indexes plus one rank per Joker.
+        With suited set, 5 different ranks count as a flush.
+    """
+    best = 0
+    for extra in itertools.combinations_with_replacement(range(len(ev.RANKCHARS)), jokers):
+        combo = ranks + list(extra)
+        if any(combo.count(r) > MAXRANKS for r in extra):
+            continue
+
+        if len(combo) == ev.HANDSIZE and len(set(combo)) == ev.HANDSIZE:
+            mask = sum(1 << r for r in combo)
+            value = ev.FLUSHES[mask] if suited else ev.UNIQUE5[mask]
+        else:
+            product = 1
+            for r in combo:
+                product *= ev.PRIMES[r]
+            value = ev.PRODUCTS[product]
+        best = max(best, value)
+    return best
+
+
+def best_hand(cards):
+    """ Finds the best 5 cards with the Jokers wild and returns a (value, hand)
+        tuple. Hands of 5 cards or less are valued as they are. A Joker can
+        always stand in for a card it replaces, so only the 5 card hands that
+        keep as many Jokers as possible are tried.
+    """
+    if len(cards) <= ev.HANDSIZE:
+        return get_value(cards), tuple(cards)
+
+    jokers = [c for c in cards if c.id == pc.JOKER_ID][:ev.HANDSIZE]
+    if not jokers:
+        return ev.find_best_hand_fast(cards)
+
+    others = [c for c in cards if c.id != pc.JOKER_ID]
+    best = None
+    for combo in itertools.combinations(others, ev.HANDSIZE - len(jokers)):
+        hand = tuple(jokers) + combo
+        value = get_value(hand)
+        if best is None or value > best[0]:
+            best = value, hand
+    return best
+
+
+def best_value(cards):
+    """ Returns the value of the best 5 cards with the Jokers wild. """
+    return best_hand(cards)[0]
@@ -48,13 +48,93 @@ class PokerHand(Hand):
         * This hand will keep track of the value of a hand as it is updated.
         * The cards will not be accessible by the outside, only by adding or
         * discarding from the CardList methods.
+        * Rank counts, suit counts, the rankmask and prime product are kept up
+        * to date as cards come and go. Up to 5 regular cards are valued by a
+        * table lookup and 6 or 7 from the rank and suit counts; hands with
+        * Jokers go to the evaluator.
     """
     def __init__(self):
         # Initialize as a new empty Hand
         Hand.__init__(self)
+        self._rankcounts = [0] * len(ev.RANKCHARS)
+        self._suitcounts = [0] * 4
+        self._rankmask = 0
+        self._product = 1
+        self._jokers = 0
         self.update()
 
+    def add(self, card):
+        """ Adds a card and updates the value. """
+        Hand.add(self, card)
+        self._count(card, 1)
+        self.update()
+
+    def discard(self, card):
+        """ Removes a card, updates the value and returns the card. """
+        copy = Hand.discard(self, card)
+        self._count(copy, -1)
+        self.update()
+        return copy
+
+    def _count(self, card, step):
+        """ Adds (step=1) or removes (step=-1) a card from the running counts. """
+        if card.id >= len(ev.CARDCODES):
+            self._jokers += step
+            return
+        code = ev.CARDCODES[card.id]
+        r = code >> 8 & 0xF
+        self._rankcounts[r] += step
+        self._suitcounts[card.id // 13] += step
+        if self._rankcounts[r]:
+            self._rankmask |= 1 << r
+        else:
+            self._rankmask &= ~(1 << r)
+        if step > 0:
+            self._product *= code & 0xFF
+        else:
+            self._product //= code & 0xFF
+
     def update(self):
-        self.value = ev.ev.get_value(self.cards)
-        self.description = ev.get_description(self.value, self.cards)
+        """ Works out the value and type of the current cards. Hands of up to
+            5 regular cards come straight from the evaluator tables and longer
+            hands from the running counts.
+        """
+        self._description = None
+        size = len(self.cards)
+
+        if size == 0:
+            self.value = ev.HANDTYPES['INVALID']
+        elif self._jokers:
+            self.value = ev.get_value(self.cards)
+        elif size > ev.HANDSIZE:
+            self.value = self._score_counts(size)
+        else:
+            if size == ev.HANDSIZE and bin(self._rankmask).count('1') == ev.HANDSIZE:
+                if ev.HANDSIZE in self._suitcounts:
+                    value = ev.FLUSHES[self._rankmask]
+                else:
+                    value = ev.UNIQUE5[self._rankmask]
+            else:
+                value = ev.PRODUCTS.get(self._product)
+            self.value = value if value is not None else ev.get_value(self.cards)
         self.rank = ev.get_type(self.value)
+
+    def _score_counts(self, size):
+        """ Values more than 5 regular cards from the running counts, the same
+            way evaluator.score_hand does without sorting the cards.
+        """
+        ranklist = [ev.Ranklist(qty=n, rank=ev.RANKCHARS[r])
+                    for r, n in reversed(list(enumerate(self._rankcounts))) if n]
+        ranklist.sort(key=lambda x: -x.qty)
+        if len(ranklist) < ev.HANDSIZE:
+            return ev.score_pair_hands(self.cards, ranklist)
+        elif len(ranklist) == ev.HANDSIZE:
+            return ev.score_unique_hands(0, size in self._suitcounts, ranklist)
+        return ev.HANDTYPES['INVALID']
+
+    @property
+    def description(self):
+        """ The text description of the hand, only worked out when asked for. """
+        if self._description is None:
+            self._description = ev.get_description(self.value, self.cards)
+        return self._description
@@ -38,3 +38,8 @@ def is_integer(num):
         return False
 
     return num.is_integer()
+
+
+def popcount(num):
+    """ Returns how many bits are set in a non-negative integer. """
+    return bin(num).count('1')
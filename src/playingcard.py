@@ -1,3 +1,4 @@
+import re
 from . import card
 
 joker_rank, joker_suit = 'Z', 's'
@@ -6,6 +7,12 @@ SUITVALUES = {'c': 1, 'd': 2, 'h': 3, 's': 4}
 FACECARDS = {'T': 10, 'J': 11, 'Q': 12, 'K': 13, 'A': 14, 'Z': 15}
 RANKS = dict({str(x): x for x in range(2, 10)}, **FACECARDS)
 
+# Integer ids: 13 * suit index + rank value - 2, so 0 = 2c and 51 = As.
+# Jokers share the id after the standard deck.
+JOKER_ID = 52
+CARD_IDS = dict({r + s: 13 * i + RANKS[r] - 2 for i, s in enumerate(SUITS)
+                 for r in RANKS if r != joker_rank}, **{joker_rank + joker_suit: JOKER_ID})
+
 
 def std_deck():
     return [PlayingCard(r, s) for s in SUITS
@@ -13,7 +20,12 @@ def std_deck():
 
 
 class PlayingCard(card.Card):
-    """ Manages an instance of a PlayingCard, which has a rank and suit."""
+    """ Manages an instance of a PlayingCard, which has a rank and suit. The
+        integer id, rank value, rank bit and suit bit are worked out once so
+        comparing and hashing cards doesn't need any dictionary lookups.
+    """
+    __slots__ = ('rank', 'suit', 'id', 'value', 'rankbit', 'suitbit')
+
     def __init__(self, rank, suit):
         if rank not in RANKS:
             raise ValueError('Corrupt card construction - {} is not a valid rank!'.format(rank))
@@ -23,21 +35,109 @@ class PlayingCard(card.Card):
 
         self.rank = rank
         self.suit = suit
+        self.id = CARD_IDS.get(rank + suit, JOKER_ID)
+        self.value = RANKS[rank]
+        self.rankbit = 1 << (self.value - 2)
+        self.suitbit = 1 << SUITS.index(suit)
+
+    def __eq__(self, other):
+        """ Returns True if this card has the same rank and suit as the other card. """
+        if isinstance(other, PlayingCard):
+            return self.id == other.id
+        return card.Card.__eq__(self, other)
+
+    def __hash__(self):
+        return self.id
 
     def __gt__(self, other):
         """ Returns True if this card's rank is greater than the other card, False otherwise. """
-        return RANKS[self.rank] > RANKS[other.rank]
+        return self.value > other.value
 
     def __lt__(self, other):
         """ Returns True if this card's rank is lesser than the other card, False otherwise. """
-        return RANKS[self.rank] < RANKS[other.rank]
+        return self.value < other.value
 
     def val(self):
         """ Returns the value of the Cards rank. """
-        return RANKS[self.rank]
+        return self.value
+
+    def copy(self):
+        """ Returns a new copy of the card without checking its rank and suit
+            over again.
+        """
+        c = object.__new__(self.__class__)
+        c.top_text, c.back_text, c.hidden = self.top_text, self.back_text, self.hidden
+        c.rank, c.suit, c.id, c.value = self.rank, self.suit, self.id, self.value
+        c.rankbit, c.suitbit = self.rankbit, self.suitbit
+        return c
 
 
 class Joker(PlayingCard):
     """ Manages a single instance of a Joker PlayingCard"""
+    __slots__ = ()
+
     def __init__(self):
         PlayingCard.__init__(self, joker_rank, joker_suit)
+
+
+class CardParseError(ValueError):
+    """ Raised by parse_cards for text that isn't a card. position is where the
+        bad token starts: a character offset into a string, or the index of
+        the item in a list.
+    """
+    def __init__(self, token, position):
+        ValueError.__init__(self, '{!r} at position {} is not a card!'.format(token, position))
+        self.token = token
+        self.position = position
+
+
+def parse_cards(text, ids=False, interned=False):
+    """ Parses cards written like 'AsKdQh', 'As Kd Qh' or 'As,Kd,Qh', or a list
+        of card strings. Returns a list of new PlayingCards, or the card ids
+        with ids set. With interned set the cards are shared objects from
+        INTERNED, which are faster but must not be changed. Raises a
+        CardParseError at the first bad token.
+    """
+    try:
+        if isinstance(text, str):
+            found = parse_ids(text)
+        else:
+            found = [CARD_IDS[t] for t in text]
+    except (KeyError, TypeError):
+        raise find_parse_error(text) from None
+
+    if ids:
+        return found
+    elif interned:
+        return [INTERNED[i] for i in found]
+    return [INTERNED[i].copy() for i in found]
+
+
+def parse_ids(text):
+    """ Looks up the ids of the cards in a string. Separated cards are tried
+        first, then every word is cut into 2 character tokens.
+    """
+    words = text.replace(',', ' ').split()
+    try:
+        return [CARD_IDS[w] for w in words]
+    except KeyError:
+        return [CARD_IDS[w[i:i + 2]] for w in words for i in range(0, len(w), 2)]
+
+
+def find_parse_error(text):
+    """ Returns a CardParseError for the first bad token in the text. """
+    if not isinstance(text, str):
+        for i, t in enumerate(text):
+            if not isinstance(t, str) or t not in CARD_IDS:
+                return CardParseError(t, i)
+
+    for m in TOKEN_SPLIT.finditer(text):
+        word = m.group()
+        for i in range(0, len(word), 2):
+            if word[i:i + 2] not in CARD_IDS:
+                return CardParseError(word[i:i + 2], m.start() + i)
+
+
+TOKEN_SPLIT = re.compile(r'[^\s,]+')
+# One shared card for every id, the Joker last.
+INTERNED = tuple(std_deck()) + (Joker(),)
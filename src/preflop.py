@@ -0,0 +1,257 @@
+""" Precomputed heads-up preflop equities.
+
+    Tables are generated offline by generate() and saved as a binary file:
+    a header, one done flag per row and a size x size grid of little endian
+    uint16 equities. Each cell is hero's (row) equity against villain
+    (column), scaled so SCALE is 100%. Rows are filled in one at a time, so
+    an interrupted generate() picks up where it stopped. Files are mmap'ed
+    the first time preflop_equity reads them.
+
+    The 169 table is indexed by starting hand class (AA, AKs, AKo, ...), the
+    1326 table by exact two card combination.
+"""
+
+import mmap
+import os
+import random
+import secrets
+import struct
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from . import equity as eq
+from . import evaluator as ev
+
+MAGIC = b'PFEQ'
+VERSION = 1
+HEADER = struct.Struct('<4sHHIQ')  # magic, version, size, trials, seed
+CELL = struct.Struct('<H')
+SCALE = 0xFFFE
+MISSING = 0xFFFF
+CLASSES, COMBOS = 169, 1326
+
+DATA_DIR = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), 'data')
+PATHS = {
+    CLASSES: os.path.join(DATA_DIR, 'preflop169.eq'),
+    COMBOS: os.path.join(DATA_DIR, 'preflop1326.eq'),
+}
+
+# Ranks from the Ace down, as in the usual 13x13 starting hand grid.
+GRID_RANKS = tuple(reversed(ev.RANKCHARS))
+# Two card combinations as (higher id, lower id), indexed by a*(a-1)/2 + b
+COMBO_IDS = tuple((a, b) for a in range(eq.DECKSIZE) for b in range(a))
+
+_tables = {}
+
+
+def class_name(index):
+    """ Returns the name of a starting hand class: 'AA', 'AKs' or 'AKo'. On the
+        grid, pairs are on the diagonal, suited hands above it and offsuit
+        hands below it.
+    """
+    row, col = divmod(index, 13)
+    if row == col:
+        return GRID_RANKS[row] * 2
+    elif row < col:
+        return GRID_RANKS[row] + GRID_RANKS[col] + 's'
+    return GRID_RANKS[col] + GRID_RANKS[row] + 'o'
+
+
+def class_index(hand):
+    """ Returns the class index of a name like 'AKs' or a pair of cards/ids. """
+    if isinstance(hand, str):
+        try:
+            return CLASS_NAMES.index(hand)
+        except ValueError:
+            raise ValueError('{} is not a starting hand class!'.format(hand))
+
+    a, b = eq.to_ids(hand)
+    hi, lo = sorted((12 - a % 13, 12 - b % 13))
+    if a // 13 == b // 13:
+        return hi * 13 + lo
+    return lo * 13 + hi
+
+
+def class_combos(index):
+    """ Returns the combinations of card ids in a starting hand class. """
+    return CLASS_COMBOS[index]
+
+
+def group_combos():
+    """ Sorts the 1326 combinations into their starting hand classes. """
+    groups = tuple([] for _ in range(CLASSES))
+    for c in COMBO_IDS:
+        groups[class_index(c)].append(c)
+    return groups
+
+
+def combo_index(hand):
+    """ Returns the index of a pair of cards/ids in the 1326 combinations. """
+    a, b = sorted(eq.to_ids(hand), reverse=True)
+    if a == b:
+        raise ValueError('A starting hand needs 2 different cards!')
+    return a * (a - 1) // 2 + b
+
+
+def matchup_equity(heroes, villains, trials, rng):
+    """ Returns the average equity of the hero combos against the villain
+        combos, over every pair that doesn't share a card. With trials set the
+        equity is sampled, otherwise it is enumerated exactly. Returns None if
+        every pair shares a card.
+    """
+    pairs = [(h, v) for h in heroes for v in villains if not set(h) & set(v)]
+    if not pairs:
+        return None
+    elif not trials:
+        return sum(float(eq.exact_equity(h, v).equity) for h, v in pairs) / len(pairs)
+
+    score = 0
+    for _ in range(trials):
+        h, v = rng.choice(pairs)
+        board = tuple(c for c in rng.sample(range(eq.DECKSIZE), eq.BOARDSIZE + 4)
+                      if c not in h and c not in v)[:eq.BOARDSIZE]
+        hero_val, villain_val = ev.best_value(h + board), ev.best_value(v + board)
+        score += 2 if hero_val > villain_val else hero_val == villain_val
+    return score / (2 * trials)
+
+
+def compute_row(size, row, trials, seed):
+    """ Works out the equities of row against every column from row onwards.
+        Module level so it can be sent to worker processes.
+    """
+    if size == CLASSES:
+        hands = [class_combos(i) for i in range(size)]
+    else:
+        hands = [[c] for c in COMBO_IDS]
+
+    rng = random.Random('{}:{}'.format(seed, row))
+    return row, [matchup_equity(hands[row], hands[col], trials, rng) for col in range(row, size)]
+
+
+def create(path, size, trials, seed):
+    """ Writes an empty table file: the header, cleared done flags and every
+        cell MISSING.
+    """
+    if os.path.dirname(path):
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+    with open(path, 'wb') as f:
+        f.write(HEADER.pack(MAGIC, VERSION, size, trials, seed))
+        f.write(bytes(size))
+        f.write(CELL.pack(MISSING) * (size * size))
+
+
+def read_header(data):
+    """ Returns (size, trials, seed) from the start of a table file. """
+    magic, version, size, trials, seed = HEADER.unpack_from(data)
+    if magic != MAGIC:
+        raise ValueError('Not a preflop equity table!')
+    if version != VERSION:
+        raise ValueError('Preflop table version {} is not supported!'.format(version))
+    if size not in PATHS:
+        raise ValueError('Preflop tables are {} or {} hands!'.format(CLASSES, COMBOS))
+    return size, trials, seed
+
+
+def generate(path=None, size=CLASSES, trials=1000, workers=1, seed=None, rows=None):
+    """ Fills in the rows of a preflop table that aren't done yet, creating the
+        file first if needed. trials=0 enumerates every board exactly. rows
+        limits how many rows are done in this call. Returns how many rows are
+        still left.
+    """
+    path = path or PATHS[size]
+    if not os.path.exists(path):
+        create(path, size, trials, secrets.randbits(63) if seed is None else seed)
+
+    with open(path, 'r+b') as f:
+        mm = mmap.mmap(f.fileno(), 0)
+        try:
+            size, trials, seed = check_file(mm, size, trials)
+            todo = [r for r in range(size) if not mm[HEADER.size + r]]
+            jobs = todo if rows is None else todo[:rows]
+
+            if workers > 1:
+                with ProcessPoolExecutor(max_workers=workers) as executor:
+                    futures = [executor.submit(compute_row, size, r, trials, seed) for r in jobs]
+                    for future in as_completed(futures):
+                        write_row(mm, size, *future.result())
+            else:
+                for r in jobs:
+                    write_row(mm, size, *compute_row(size, r, trials, seed))
+        finally:
+            mm.close()
+    _tables.pop(path, None)
+    return len(todo) - len(jobs)
+
+
+def check_file(data, size, trials):
+    """ Makes sure an existing file was started with the same settings. """
+    found = read_header(data)
+    if found[:2] != (size, trials):
+        raise ValueError('Table was started with size {} and {} trials!'.format(*found[:2]))
+    return found
+
+
+def write_row(mm, size, row, equities):
+    """ Writes a finished row, mirrors it into its column and marks it done. """
+    start = HEADER.size + size
+    for col, e in enumerate(equities, row):
+        if e is None:
+            continue
+        CELL.pack_into(mm, start + 2 * (row * size + col), round(e * SCALE))
+        if col != row:
+            CELL.pack_into(mm, start + 2 * (col * size + row), SCALE - round(e * SCALE))
+    mm[HEADER.size + row] = 1
+    mm.flush()
+
+
+class PreflopTable(object):
+    """ A read-only, memory-mapped preflop equity table. """
+    def __init__(self, path):
+        with open(path, 'rb') as f:
+            self._mm = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+        self.size, self.trials, self.seed = read_header(self._mm)
+        self._cells = HEADER.size + self.size
+
+    def __len__(self):
+        return self.size
+
+    def is_done(self, row):
+        """ Returns True if the row has been generated. """
+        return self._mm[HEADER.size + row] == 1
+
+    def equity(self, row, col):
+        """ Returns row's equity against col as a percentage. Cells below the
+            diagonal are filled in by their mirror row.
+        """
+        if not self.is_done(min(row, col)):
+            raise ValueError('That part of the preflop table has not been generated!')
+        value = CELL.unpack_from(self._mm, self._cells + 2 * (row * self.size + col))[0]
+        if value == MISSING:
+            raise ValueError('Those hands share a card!')
+        return 100 * value / SCALE
+
+
+def load(path):
+    """ Returns the table at path, mapping it into memory on first use. """
+    if path not in _tables:
+        _tables[path] = PreflopTable(path)
+    return _tables[path]
+
+
+def preflop_equity(hand_a, hand_b, path=None):
+    """ Returns hand_a's all-in preflop equity against hand_b as a percentage.
+        Hands can be class names like 'AKs', which use the 169 table, or
+        pairs of cards/ids, which use the 1326 table if it has been generated
+        and their classes otherwise.
+    """
+    if isinstance(hand_a, str) or isinstance(hand_b, str):
+        return load(path or PATHS[CLASSES]).equity(class_index(hand_a), class_index(hand_b))
+
+    if path is None:
+        path = PATHS[COMBOS] if os.path.exists(PATHS[COMBOS]) else PATHS[CLASSES]
+    table = load(path)
+    if len(table) == COMBOS:
+        return table.equity(combo_index(hand_a), combo_index(hand_b))
+    return table.equity(class_index(hand_a), class_index(hand_b))
+
+
+CLASS_NAMES = tuple(class_name(i) for i in range(CLASSES))
+CLASS_COMBOS = group_combos()
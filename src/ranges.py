@@ -0,0 +1,187 @@
+""" Parses hand ranges in the usual notation and expands them into combos.
+
+    A range is a comma separated list of:
+        AA, AKs, AKo    a starting hand class; AK means both AKs and AKo
+        TT+, ATs+       a pair and every higher pair, or a hand and every
+                        higher kicker below the top card
+        22-55, A2s-A5s  every pair or kicker between the two ends
+        AsKs            one exact combo
+    Any of them can end with a weight, like QQ:0.5, for how often the hand is
+    played. Later parts override the weights of earlier ones.
+
+    Combos are (higher id, lower id) pairs of card ids, numbered as in
+    preflop.COMBO_IDS. A range keeps its combos as a 1326 bit mask so dead
+    cards can be removed with a few integer operations.
+"""
+
+import bisect
+import itertools
+import random
+import re
+from . import equity as eq
+from . import playingcard as pc
+from . import preflop
+
+RANKCHARS = ''.join(preflop.GRID_RANKS)
+CLASS_PATTERN = re.compile(r'^([2-9TJQKA])([2-9TJQKA])([so]?)(\+?)$')
+COMBO_PATTERN = re.compile(r'^([2-9TJQKA][cdhs])([2-9TJQKA][cdhs])$')
+
+MAXREJECTS = 64
+MASKBYTES = (preflop.COMBOS + 7) // 8
+# The set bits of every byte value.
+BYTE_BITS = tuple(tuple(b for b in range(8) if n >> b & 1) for n in range(256))
+# The combos holding each card id, as 1326 bit masks.
+CARD_COMBOS = tuple(sum(1 << i for i, c in enumerate(preflop.COMBO_IDS) if card in c)
+                    for card in range(eq.DECKSIZE))
+
+
+def dead_mask(cards):
+    """ Returns the mask of combos blocked by some cards/ids. """
+    mask = 0
+    for i in eq.to_ids(cards):
+        mask |= CARD_COMBOS[i]
+    return mask
+
+
+def iter_combos(mask):
+    """ Yields the combo indexes in a 1326 bit mask, lowest first. The mask is
+        read a byte at a time so empty stretches are skipped cheaply.
+    """
+    for offset, byte in enumerate(mask.to_bytes(MASKBYTES, 'little')):
+        if byte:
+            for bit in BYTE_BITS[byte]:
+                yield 8 * offset + bit
+
+
+def class_mask(name):
+    """ Returns the mask of combos in a starting hand class like 'AKs'. """
+    return CLASS_MASKS[preflop.class_index(name)]
+
+
+def expand_classes(token):
+    """ Returns the starting hand class names written as one part of a range,
+        e.g. ['AKs', 'AKo'] for 'AK' or ['QQ', 'KK', 'AA'] for 'QQ+'.
+    """
+    if '-' in token:
+        start, end = token.split('-', 1)
+        first, last = split_class(start), split_class(end)
+        if first[0] == first[1] and last[0] == last[1]:
+            lo, hi = sorted((first[0], last[0]), key=RANKCHARS.index, reverse=True)
+            return pairs_between(lo, hi)
+        if first[0] != last[0] or first[2] != last[2] or first[3] or last[3]:
+            raise ValueError('{} is not a valid range of hands!'.format(token))
+        lo, hi = sorted((first[1], last[1]), key=RANKCHARS.index, reverse=True)
+        return kickers_between(first[0], lo, hi, first[2])
+
+    high, low, suited, plus = split_class(token)
+    if high == low:
+        return pairs_between(low, 'A') if plus else [high + low]
+    elif plus:
+        return kickers_between(high, low, RANKCHARS[RANKCHARS.index(high) + 1], suited)
+    return kickers_between(high, low, low, suited)
+
+
+def split_class(token):
+    """ Returns (high rank, low rank, 's'/'o'/'', '+'/'') for a class token. """
+    match = CLASS_PATTERN.match(token)
+    if not match:
+        raise ValueError('{} is not a starting hand class!'.format(token))
+    high, low, suited, plus = match.groups()
+    if RANKCHARS.index(high) > RANKCHARS.index(low):
+        high, low = low, high
+    if high == low and suited:
+        raise ValueError('A pair cannot be suited or offsuit!')
+    return high, low, suited, plus
+
+
+def pairs_between(lo, hi):
+    """ Returns the pair names from lo up to hi. """
+    ranks = RANKCHARS[RANKCHARS.index(hi):RANKCHARS.index(lo) + 1]
+    return [r + r for r in reversed(ranks)]
+
+
+def kickers_between(high, lo, hi, suited):
+    """ Returns the names of high with every kicker from lo up to hi. """
+    ranks = RANKCHARS[RANKCHARS.index(hi):RANKCHARS.index(lo) + 1]
+    return [high + r + s for r in reversed(ranks) for s in (suited or 'so')]
+
+
+def parse(text):
+    """ Parses a range in standard notation and returns a Range. """
+    weights = {}
+    for part in text.replace(' ', '').split(','):
+        if not part:
+            continue
+        token, _, weight = part.partition(':')
+        weight = float(weight) if weight else 1.0
+        if not 0 < weight <= 1:
+            raise ValueError('Range weights must be above 0 and at most 1!')
+
+        match = COMBO_PATTERN.match(token)
+        if match:
+            mask = 1 << preflop.combo_index([pc.CARD_IDS[c] for c in match.groups()])
+        else:
+            mask = 0
+            for name in expand_classes(token):
+                mask |= class_mask(name)
+
+        for i in iter_combos(mask):
+            weights[i] = weight
+    return Range(weights)
+
+
+class Range(object):
+    """ A set of two card combos, each with a weight between 0 and 1. """
+    def __init__(self, weights=None):
+        self.weights = dict(weights or {})
+        self.mask = sum(1 << i for i in self.weights)
+        self._indexes = sorted(self.weights)
+        self._cumweights = list(itertools.accumulate(self.weights[i] for i in self._indexes))
+
+    def __len__(self):
+        return len(self.weights)
+
+    def __contains__(self, hand):
+        return self.mask >> preflop.combo_index(hand) & 1 == 1
+
+    def weight(self, hand):
+        """ Returns the weight of a combo, 0 if it isn't in the range. """
+        return self.weights.get(preflop.combo_index(hand), 0)
+
+    def live(self, dead=None):
+        """ Returns the mask of combos that don't use any of the dead cards. """
+        return self.mask & ~dead_mask(dead) if dead else self.mask
+
+    def combos(self, dead=None):
+        """ Lazily yields the (higher id, lower id) combos that don't use any of
+            the dead cards.
+        """
+        for i in iter_combos(self.live(dead)):
+            yield preflop.COMBO_IDS[i]
+
+    def sample(self, k=1, dead=None, rng=random):
+        """ Returns k combos picked with replacement by their weights, leaving
+            out any that use dead cards. Picks are drawn from the whole range
+            and redrawn if blocked; if that keeps failing the live combos are
+            listed and drawn from directly.
+        """
+        blocked = dead_mask(dead) if dead else 0
+        if not self.mask & ~blocked:
+            raise ValueError('Every combo in the range is blocked!')
+
+        picks = []
+        total = self._cumweights[-1]
+        for _ in range(k):
+            for _ in range(MAXREJECTS):
+                i = self._indexes[bisect.bisect(self._cumweights, rng.random() * total)]
+                if not blocked >> i & 1:
+                    picks.append(i)
+                    break
+            else:
+                live = list(iter_combos(self.mask & ~blocked))
+                picks.append(rng.choices(live, weights=[self.weights[i] for i in live])[0])
+        return [preflop.COMBO_IDS[i] for i in picks]
+
+
+CLASS_MASKS = tuple(sum(1 << preflop.combo_index(c) for c in preflop.class_combos(i))
+                    for i in range(preflop.CLASSES))
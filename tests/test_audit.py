@@ -0,0 +1,136 @@
+"""
+  " Tests for audit.py
+  """
+
+import pytest
+from ..src import audit
+from ..src import deck_blackjack
+from ..src import deck_joker
+from ..src import deck_lazy
+from ..src import deck_secure
+
+
+@pytest.fixture
+def log(tmpdir):
+    return audit.AuditLog(str(tmpdir.join('audit.bin')))
+
+
+def test_snapshot_dealorder():
+    d = deck_secure.SecureDeck(seed=1)
+    d.shuffle()
+    snap = d.snapshot()
+    assert len(snap.ids) == 52
+    assert list(snap.ids[:2]) == [c.id for c in d.deal_many(2)]
+    assert snap.seed == 1 and snap.shuffles == 1
+
+
+def test_snapshot_secure_noseed():
+    d = deck_secure.SecureDeck()
+    d.shuffle()
+    assert d.snapshot().seed is None
+
+
+def test_append_returnsindex(log):
+    d = deck_secure.SecureDeck(seed=2)
+    assert log.append(d.snapshot()) == 0
+    assert log.append(d.snapshot()) == 1
+    assert len(log) == 2
+
+
+def test_replay_dealorder(log):
+    d = deck_secure.SecureDeck()
+    d.shuffle()
+    i = log.append(d.snapshot())
+    assert log.replay(i) == d.deal_many(52)
+
+
+def test_record_keepsmetadata(log):
+    d = deck_secure.SecureDeck(seed='hand 7')
+    d.shuffle()
+    log.append(d.snapshot(), logged=100.0)
+    r = log.record(-1)
+    assert (r.seed, r.shuffles, r.time) == ('hand 7', 1, 100.0)
+
+
+def test_reopen_continueschain(tmpdir):
+    path = str(tmpdir.join('audit.bin'))
+    audit.AuditLog(path).append(deck_secure.SecureDeck().snapshot())
+    log = audit.AuditLog(path)
+    assert len(log) == 1
+    log.append(deck_secure.SecureDeck(seed=3).snapshot())
+    assert audit.AuditLog(path).verify() == 2
+
+
+def test_tampered_raiseEx(log):
+    for seed in range(3):
+        log.append(deck_secure.SecureDeck(seed=seed).snapshot())
+    with open(log.path, 'r+b') as f:
+        f.seek(log._offsets[1] + audit.RECORD.size)
+        f.write(b'\x33')
+    with pytest.raises(ValueError):
+        log.verify()
+
+
+def test_removedrecord_raiseEx(tmpdir):
+    path = str(tmpdir.join('audit.bin'))
+    log = audit.AuditLog(path)
+    for seed in range(3):
+        log.append(deck_secure.SecureDeck(seed=seed).snapshot())
+    with open(path, 'rb') as f:
+        data = f.read()
+    with open(path, 'wb') as f:
+        f.write(data[:log._offsets[1]] + data[log._offsets[2]:])
+    with pytest.raises(ValueError):
+        audit.AuditLog(path)
+
+
+def test_badmagic_raiseEx(tmpdir):
+    path = tmpdir.join('bad.bin')
+    path.write_binary(b'nope' * 4)
+    with pytest.raises(ValueError):
+        audit.AuditLog(str(path))
+
+
+@pytest.mark.parametrize('make, size', [
+    (lambda: deck_lazy.LazyDeck(seed=4), 52),
+    (lambda: deck_blackjack.Shoe(decks=2, seed=4), 104),
+    (lambda: deck_blackjack.BlackjackDeck(2, seed=4), 104),
+    (lambda: deck_joker.DeckJoker(2, seed=4), 54),
+])
+def test_replay_everydeck(log, make, size):
+    d = make()
+    d.shuffle()
+    d.deal_many(3)
+    i = log.append(d.snapshot())
+    assert len(log.record(i).ids) == size - 3
+    assert [c.id for c in log.replay(i)] == [c.id for c in d.deal_many(size - 3)]
+
+
+def test_lazy_snapshot_partlydealt(log):
+    d = deck_lazy.LazyDeck(seed=5)
+    snap = d.snapshot()
+    assert d.deal_ids(10) == list(snap.ids[:10])
+    assert d.snapshot().ids == snap.ids[10:]
+
+
+def test_lazy_reset_reshuffles():
+    d = deck_lazy.LazyDeck(seed=6)
+    first = d.snapshot()
+    d.reset()
+    assert sorted(d.snapshot().ids) == sorted(first.ids)
+    assert d._fixed == 52
+    d.reset()
+    assert d._fixed == 0
+
+
+def test_lazy_deal_aftersnapshot(log):
+    d = deck_lazy.LazyDeck(seed=1)
+    i = log.append(d.snapshot())
+    assert [d.deal().id for _ in range(52)] == [c.id for c in log.replay(i)]
+
+
+def test_shoe_dealid_aftersnapshot():
+    s = deck_blackjack.Shoe(2, seed=3)
+    snap = s.snapshot()
+    assert [s.deal_id() for _ in range(5)] == list(snap.ids[:5])
+    assert s.seen[snap.ids[0] % 13] >= 1
@@ -0,0 +1,45 @@
+"""
+  " Tests for benchmark.py
+  """
+from ..src import benchmark as bm
+
+
+def test_corpus_sameseed_samehands():
+    assert bm.corpus(7, 10, seed=1) == bm.corpus(7, 10, seed=1)
+
+
+def test_corpus_size6_6cardhands():
+    assert all(len(h) == 6 and len(set(h)) == 6 for h in bm.corpus(6, 10))
+
+
+def test_run_resultperNameAndSize():
+    report = bm.run(['get_value', 'rank_list'], sizes=(5, 7), qty=5, repeats=1)
+    assert sorted(report['results']) == ['get_value/5', 'get_value/7', 'rank_list/5', 'rank_list/7']
+
+
+def test_compare_slower_flagged():
+    old = {'results': {'get_value/5': 1.0, 'rank_list/5': 1.0}}
+    new = {'results': {'get_value/5': 1.5, 'rank_list/5': 1.05}}
+    assert bm.compare(old, new, threshold=0.1) == [('get_value/5', 1.0, 1.5)]
+
+
+def test_compare_missingkey_ignored():
+    assert bm.compare({'results': {'get_value/5': 1.0}}, {'results': {}}) == []
+
+
+def test_main_writesjson(tmpdir):
+    path = str(tmpdir.join('bench.json'))
+    assert bm.main(['-n', '3', '-r', '1', '-o', path, 'get_value']) == 0
+    assert bm.main(['-n', '3', '-r', '1', '-t', '1000', '-c', path, 'get_value']) == 0
+
+
+def test_card_corpus_shoesize():
+    shoe, probes = bm.card_corpus(416, 10)
+    assert len(shoe) == 416 and len(probes) == 10
+    assert bm.card_corpus(416, 10, seed=1)[1] == bm.card_corpus(416, 10, seed=1)[1]
+
+
+def test_run_cardlists_bothclasses():
+    report = bm.run(['CardList.discard', 'IndexedCardList.discard'], qty=5, repeats=1,
+                    cardlist_sizes=(52,))
+    assert sorted(report['results']) == ['CardList.discard/52', 'IndexedCardList.discard/52']
@@ -1,4 +1,5 @@
 import pytest
+import random
 from ..src import cardlist
 from ..src import playingcard as pc
 from . import tools
@@ -206,3 +207,72 @@ def test_stripsuits_stripMultipleSuits_allSuitsWereStripped():
     cl.cards = cl.strip_suits(suits=['s', 'c'])
     assert cl.count_suit('s') == 0
     assert cl.count_suit('c') == 0
+
+
+@pytest.fixture
+def indexed_deck():
+    return cardlist.IndexedCardList(pc.std_deck())
+
+
+def test_indexed_countsuit_13(indexed_deck):
+    assert indexed_deck.count_suit('s') == 13
+
+
+def test_indexed_countrank_4(indexed_deck):
+    assert indexed_deck.count_rank('A') == 4
+
+
+def test_indexed_discard_updatescounts(indexed_deck, ace):
+    assert indexed_deck.discard(ace) == ace
+    assert ace not in indexed_deck
+    assert len(indexed_deck) == 51
+    assert indexed_deck.count_rank('A') == 3
+    assert indexed_deck.count_suit('s') == 12
+
+
+def test_indexed_discard_missing_raiseEx(ace):
+    with pytest.raises(ValueError):
+        cardlist.IndexedCardList().discard(ace)
+
+
+def test_indexed_cards_keepsorder(indexed_deck):
+    indexed_deck.discard(pc.PlayingCard('3', 'c'))
+    expected = [c for c in pc.std_deck() if c.rank + c.suit != '3c']
+    assert indexed_deck.cards == expected
+
+
+def test_indexed_duplicates_discardsfirst(ace):
+    first, second = pc.PlayingCard('A', 's'), pc.PlayingCard('A', 's')
+    cl = cardlist.IndexedCardList([first, pc.PlayingCard('K', 'h'), second])
+    assert cl.discard(ace) is first
+    assert ace in cl
+    assert cl.count_rank('A') == 1
+
+
+def test_indexed_remove_missing_returnsNone(ace):
+    assert cardlist.IndexedCardList().remove(ace) is None
+
+
+def test_indexed_sort_reindexes():
+    cl = cardlist.IndexedCardList(tools.to_cards(['As', '2c', 'Kd']))
+    cl.sort()
+    assert [c.rank for c in cl.cards] == ['2', 'K', 'A']
+    assert cl.discard(pc.PlayingCard('K', 'd')).rank == 'K'
+
+
+def test_indexed_randomops_matchcardlist():
+    rng = random.Random(0)
+    plain = cardlist.CardList(pc.std_deck() * 2)
+    indexed = cardlist.IndexedCardList(pc.std_deck() * 2)
+    for _ in range(500):
+        c = rng.choice(pc.std_deck())
+        if c in plain and rng.random() < 0.7:
+            assert plain.discard(c) == indexed.discard(c)
+        else:
+            plain.add(c)
+            indexed.add(c)
+        assert indexed.count_rank(c.rank) == plain.count_rank(c.rank)
+        assert indexed.count_suit(c.suit) == plain.count_suit(c.suit)
+        assert (c in indexed) == (c in plain)
+    assert indexed.cards == plain.cards
+    assert str(indexed) == str(plain)
@@ -0,0 +1,115 @@
+"""
+  " Tests for cardset.py
+  """
+import pytest
+from ..src import cardlist
+from ..src import cardset
+from ..src import playingcard as pc
+from . import tools
+
+
+@pytest.fixture
+def cs():
+    return cardset.CardSet(tools.to_cards(['As', 'Ks', 'Kd', '2c']))
+
+
+def test_init_ids_samecards(cs):
+    assert cardset.CardSet([51, 50, 24, 0]) == cs
+
+
+def test_init_cardlist_samecards(cs):
+    cl = cardlist.CardList(tools.to_cards(['As', 'Ks', 'Kd', '2c']))
+    assert cardset.CardSet(cl) == cs
+
+
+def test_init_empty_len0():
+    assert len(cardset.CardSet()) == 0
+    assert cardset.CardSet().is_empty()
+
+
+def test_len(cs):
+    assert len(cs) == 4
+
+
+def test_contains_card(cs):
+    assert pc.PlayingCard('K', 'd') in cs
+    assert pc.PlayingCard('K', 'h') not in cs
+
+
+def test_contains_id(cs):
+    assert 51 in cs
+
+
+def test_iter_idorder(cs):
+    assert [c.id for c in cs] == [0, 24, 50, 51]
+
+
+def test_str(cs):
+    assert str(cs) == '2c Kd Ks As'
+
+
+def test_hash_samecards_samekey(cs):
+    d = {cs: 1}
+    assert d[cardset.CardSet(reversed(tools.to_cards(['As', 'Ks', 'Kd', '2c'])))] == 1
+
+
+def test_union_difference(cs):
+    other = cardset.CardSet(tools.to_cards(['As', 'Qh']))
+    assert str(cs | other) == '2c Kd Qh Ks As'
+    assert str(cs - other) == '2c Kd Ks'
+    assert str(cs & other) == 'As'
+    assert str(cs ^ other) == '2c Kd Qh Ks'
+
+
+def test_add_returnsnewset(cs):
+    bigger = cs.add(pc.PlayingCard('Q', 'h'))
+    assert len(bigger) == 5 and len(cs) == 4
+
+
+def test_discard_removescard(cs):
+    assert str(cs.discard(pc.PlayingCard('A', 's'))) == '2c Kd Ks'
+
+
+def test_discard_missing_raiseEx(cs):
+    with pytest.raises(ValueError):
+        cs.discard(pc.PlayingCard('A', 'h'))
+
+
+def test_countsuit_spades2(cs):
+    assert cs.count_suit('s') == 2
+
+
+def test_countrank_kings2(cs):
+    assert cs.count_rank('K') == 2
+
+
+def test_stripranks(cs):
+    assert str(cs.strip_ranks(['K', '2'])) == 'As'
+
+
+def test_stripsuits(cs):
+    assert str(cs.strip_suits(['s'])) == '2c Kd'
+
+
+def test_tocardlist(cs):
+    cl = cs.to_cardlist()
+    assert isinstance(cl, cardlist.CardList)
+    assert [c.id for c in cl.cards] == [0, 24, 50, 51]
+
+
+def test_joker_roundtrip():
+    s = cardset.CardSet([pc.Joker()])
+    assert s.count_rank('Z') == 1
+    assert isinstance(list(s)[0], pc.Joker)
+
+
+def test_joker_countsassuit_likecardlist():
+    cards = tools.to_cards(['As']) + [pc.Joker()]
+    s = cardset.CardSet(cards)
+    assert s.count_suit('s') == cardlist.CardList(cards).count_suit('s') == 2
+    assert s.strip_suits(['s']).is_empty()
+
+
+def test_mask_readonly(cs):
+    with pytest.raises(AttributeError):
+        cs.mask = 0
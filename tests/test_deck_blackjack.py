@@ -30,3 +30,74 @@ def test_init_4shoes_4AceSpaces():
     d = bj.mk_blackjack_deck(4)
     c = pc.PlayingCard('A', 's')
     assert d.count(c) == 4
+
+
+def test_mkblackjackdeck_2shoes_distinctobjects():
+    d = bj.mk_blackjack_deck(2)
+    assert d[0] == d[52] and d[0] is not d[52]
+
+
+def test_blackjackdeck_2shoes_104cards():
+    assert len(bj.BlackjackDeck(2)) == 104
+
+
+def test_shoe_6decks_312cards():
+    assert len(bj.Shoe(6)) == 312
+
+
+def test_shoe_0decks_raiseException():
+    with pytest.raises(ValueError):
+        bj.Shoe(0)
+
+
+def test_shoe_badpenetration_raiseException():
+    with pytest.raises(ValueError):
+        bj.Shoe(6, penetration=1.5)
+
+
+def test_shoe_dealall_everycardNtimes():
+    s = bj.Shoe(2, seed=1)
+    assert sorted(s.deal_ids(104)) == sorted(list(range(52)) * 2)
+    with pytest.raises(Exception):
+        s.deal_id()
+
+
+def test_shoe_cutcard_needsshuffle():
+    s = bj.Shoe(1, penetration=0.5, seed=1)
+    s.deal_ids(25)
+    assert not s.needs_shuffle
+    s.deal()
+    assert s.needs_shuffle
+
+
+def test_shoe_runningcount_hilo():
+    s = bj.Shoe(1, seed=2)
+    ids = [s.deal_id() for _ in range(20)]
+    assert s.running_count == sum(bj.HILO[i % 13] for i in ids)
+
+
+def test_shoe_fullshoe_countzero():
+    s = bj.Shoe(4, seed=3)
+    s.deal_many(208)
+    assert s.running_count == 0
+    assert s.remaining('A') == 0
+
+
+def test_shoe_remaining_tracksrank():
+    s = bj.Shoe(2, seed=4)
+    ranks = [c.rank for c in s.deal_many(30)]
+    assert s.remaining('K') == 8 - ranks.count('K')
+
+
+def test_shoe_shuffle_resetscounts():
+    s = bj.Shoe(2, seed=5)
+    s.deal_many(60)
+    s.shuffle()
+    assert len(s) == 104 and s.running_count == 0 and s.remaining('2') == 8
+
+
+def test_shoe_truecount():
+    s = bj.Shoe(1, seed=6)
+    s.running_count = 3
+    s._dealt = 26
+    assert s.true_count == 6
@@ -36,3 +36,11 @@ def test_mkjokerdeck_2Joker_contains2Jokers():
 
 
 # Test Joker class
+
+
+def test_deckjoker_2jokers_size54():
+    assert len(dj.DeckJoker(jokers=2)) == 54
+
+
+def test_deckjoker_dealsjokerfirst():
+    assert isinstance(dj.DeckJoker(jokers=1).deal(), pc.Joker)
@@ -0,0 +1,83 @@
+"""
+  " Tests for deck_lazy.py
+  """
+import pytest
+from ..src import deck_lazy
+from ..src import playingcard as pc
+
+
+@pytest.fixture
+def ld():
+    return deck_lazy.LazyDeck()
+
+
+def test_init_size52(ld):
+    assert len(ld) == 52
+
+
+def test_deal_size51(ld):
+    ld.deal()
+    assert len(ld) == 51
+
+
+def test_deal_returnsPlayingCard(ld):
+    assert isinstance(ld.deal(), pc.PlayingCard)
+
+
+def test_deal_newcardeachtime(ld):
+    c = ld.deal()
+    ld.reset()
+    assert all(ld.deal() is not c for _ in range(52))
+
+
+def test_dealid_all52_unique(ld):
+    assert sorted(ld.deal_id() for _ in range(52)) == list(range(52))
+
+
+def test_deal_empty_raiseException(ld):
+    for _ in range(52):
+        ld.deal_id()
+    with pytest.raises(Exception):
+        ld.deal()
+
+
+def test_reset_size52(ld):
+    for _ in range(10):
+        ld.deal()
+    ld.reset()
+    assert len(ld) == 52
+    assert sorted(ld.deal_id() for _ in range(52)) == list(range(52))
+
+
+def test_sameseed_samedeals():
+    a, b = deck_lazy.LazyDeck(seed=4), deck_lazy.LazyDeck(seed=4)
+    assert [a.deal_id() for _ in range(20)] == [b.deal_id() for _ in range(20)]
+
+
+def test_shuffle_keepssize(ld):
+    ld.deal()
+    ld.shuffle()
+    assert len(ld) == 51
+
+
+def test_cards_access_raiseError(ld):
+    with pytest.raises(AttributeError):
+        ld.cards
+
+
+def test_dealmany_uniquecards(ld):
+    cards = ld.deal_many(30) + ld.deal_many(22)
+    assert sorted(c.id for c in cards) == list(range(52))
+    assert len(ld) == 0
+
+
+def test_dealmany_toomany_raiseException(ld):
+    ld.deal_many(50)
+    with pytest.raises(Exception):
+        ld.deal_many(3)
+    assert len(ld) == 2
+
+
+def test_dealmany_sameseed_matchesdealid():
+    a, b = deck_lazy.LazyDeck(seed=5), deck_lazy.LazyDeck(seed=5)
+    assert [c.id for c in a.deal_many(9)] == [b.deal_id() for _ in range(9)]
@@ -5,6 +5,8 @@
 import pytest
 from ..src import card
 from ..src import deck_secure
+from ..src import player
+from ..src import table
 
 
 @pytest.fixture
@@ -66,3 +68,100 @@ def test_cards_del_raiseError(sc):
     # We should not be able to get the list
     with pytest.raises(AttributeError):
         del(sc.cards)
+
+
+def test_init_noseed_secure(sc):
+    assert sc.secure
+
+
+def test_init_seed_notsecure():
+    assert deck_secure.SecureDeck(seed=1).secure is False
+
+
+def test_shuffle_keepscards(sc):
+    sc.shuffle()
+    dealt = [sc.deal() for _ in range(52)]
+    assert sorted(c.id for c in dealt) == list(range(52))
+
+
+def test_shuffle_changesorder(sc):
+    sc.shuffle()
+    assert [sc.deal().id for _ in range(52)] != list(range(51, -1, -1))
+
+
+def test_shuffle_sameseed_sameorder():
+    a, b = deck_secure.SecureDeck(seed=7), deck_secure.SecureDeck(seed=7)
+    a.shuffle()
+    b.shuffle()
+    assert [a.deal() for _ in range(52)] == [b.deal() for _ in range(52)]
+
+
+def test_shuffle_partialdeck_keepsrest(sc):
+    dealt = {sc.deal().id for _ in range(10)}
+    sc.shuffle()
+    assert len(sc) == 42
+    assert not dealt & {sc.deal().id for _ in range(42)}
+
+
+def test_entropybuffer_randbelow_inrange():
+    e = deck_secure.EntropyBuffer(size=16)
+    for n in (1, 2, 52, 256, 257, 70000):
+        assert all(0 <= e.randbelow(n) < n for _ in range(200))
+
+
+def test_entropybuffer_read_refills():
+    e = deck_secure.EntropyBuffer(size=4)
+    assert len(e.read(3)) == 3
+    assert len(e.read(10)) == 10
+
+
+def seated_table(size, seats):
+    t = table.Table(size)
+    for i in seats:
+        t.seats[i].sitdown(player.Player('bob{}'.format(i)))
+    return t
+
+
+def test_dealmany_matchesdeal():
+    a, b = deck_secure.SecureDeck(seed=2), deck_secure.SecureDeck(seed=2)
+    a.shuffle()
+    b.shuffle()
+    assert a.deal_many(5) == [b.deal() for _ in range(5)]
+    assert len(a) == 47
+
+
+def test_dealmany_0_emptylist(sc):
+    assert sc.deal_many(0) == []
+    assert len(sc) == 52
+
+
+def test_dealmany_toomany_raiseException(sc):
+    with pytest.raises(Exception):
+        sc.deal_many(53)
+    assert len(sc) == 52
+
+
+def test_dealmany_negative_raiseValueError(sc):
+    with pytest.raises(ValueError):
+        sc.deal_many(-1)
+
+
+def test_dealround_2cardseach(sc):
+    t = seated_table(6, [0, 2, 3])
+    seats = sc.deal_round(t, 2)
+    assert [len(t.seats[i].hand) for i in range(6)] == [2, 0, 2, 2, 0, 0]
+    assert len(sc) == 46
+    assert len(seats) == 3
+
+
+def test_dealround_startsleftofbutton():
+    deck = deck_secure.SecureDeck()
+    t = seated_table(6, [0, 2, 3])
+    t.btn.seat = 2
+    deck.deal_round(t, 2)
+    # The deck deals As, Ks, Qs, ... from the top.
+    def held(i):
+        return [c.rank + c.suit for c in t.seats[i].hand.cards]
+    assert held(3) == ['As', 'Js']
+    assert held(0) == ['Ks', 'Ts']
+    assert held(2) == ['Qs', '9s']
@@ -0,0 +1,146 @@
+"""
+  " Tests for equity.py
+  """
+import itertools
+import pytest
+from fractions import Fraction
+from ..src import equity
+from ..src import evaluator as ev
+from . import tools
+
+
+def test_toids_cards_returnsIds():
+    assert equity.to_ids(tools.to_cards(['2c', 'As'])) == (0, 51)
+
+
+def test_checkcards_dupes_raiseEx():
+    with pytest.raises(ValueError):
+        equity.check_cards((51, 50), (51, 49))
+
+
+def test_checkcards_joker_raiseEx():
+    with pytest.raises(ValueError):
+        equity.check_cards((52, 50))
+
+
+def test_equity_fullboard_heroWins100():
+    hero = tools.to_cards(['As', 'Ah'])
+    villain = tools.to_cards(['Ks', 'Kh'])
+    board = tools.to_cards(['2c', '7d', '9h', 'Jc', '3s'])
+    result = equity.equity(hero, villain, board, trials=50, seed=1)
+    assert result.win == 100
+    assert result.stderr == 0
+
+
+def test_equity_fullboard_chop():
+    hero = tools.to_cards(['2s', '3h'])
+    villain = tools.to_cards(['2d', '3c'])
+    board = tools.to_cards(['Ac', 'Kd', 'Qh', 'Jc', 'Ts'])
+    result = equity.equity(hero, villain, board, trials=10, seed=1)
+    assert result.tie == 100
+    assert result.equity == 50
+
+
+def test_equity_AAvsKK_about82():
+    hero = tools.to_cards(['As', 'Ah'])
+    villain = tools.to_cards(['Ks', 'Kh'])
+    result = equity.equity(hero, villain, trials=4000, seed=7)
+    assert 78 < result.equity < 86
+    assert result.ci['equity'][0] < result.equity < result.ci['equity'][1]
+    assert result.win + result.tie + result.loss == pytest.approx(100)
+
+
+def test_equity_sameseed_sameresult():
+    hero = tools.to_cards(['As', 'Kh'])
+    villain = tools.to_cards(['Qs', 'Qh'])
+    r1 = equity.equity(hero, villain, trials=1000, seed=3, batchsize=250)
+    r2 = equity.equity(hero, villain, trials=1000, seed=3, batchsize=250, workers=2)
+    assert r1 == r2
+
+
+def test_equity_targetstderr_stopsEarly():
+    hero = tools.to_cards(['As', 'Kh'])
+    villain = tools.to_cards(['Qs', 'Qh'])
+    result = equity.equity(hero, villain, trials=100000, seed=3, batchsize=500, target_stderr=2)
+    assert result.trials < 100000
+    assert result.stderr < 2
+
+
+def test_equity_deadcards_removedFromDeck():
+    hero = tools.to_cards(['As', 'Ah'])
+    villain = tools.to_cards(['Ks', 'Kh'])
+    dead = tools.to_cards(['Kc', 'Kd'])
+    result = equity.equity(hero, villain, dead=dead, trials=1000, seed=1)
+    assert result.win > 85
+
+
+def test_equity_6cardboard_raiseEx():
+    with pytest.raises(ValueError):
+        equity.equity([0, 1], [2, 3], board=[4, 5, 6, 7, 8, 9])
+
+
+def test_summarize_0trials_raiseEx():
+    with pytest.raises(ValueError):
+        equity.summarize(0, 0, 0)
+
+
+def brute_force(hero, villain, board):
+    hero, villain, board = equity.to_ids(hero), equity.to_ids(villain), equity.to_ids(board)
+    stub = [i for i in range(52) if i not in hero + villain + board]
+    outcomes = [0, 0, 0]
+    for runout in itertools.combinations(stub, 5 - len(board)):
+        h = ev.best_value(hero + board + runout)
+        v = ev.best_value(villain + board + runout)
+        outcomes[0 if h > v else 1 if h == v else 2] += 1
+    return outcomes
+
+
+def test_exactequity_flop_matchesBruteForce():
+    hero = tools.to_cards(['Ac', 'Ad'])
+    villain = tools.to_cards(['Kc', 'Kd'])
+    board = tools.to_cards(['Qs', 'Js', 'Ts'])
+    result = equity.exact_equity(hero, villain, board)
+    wins, ties, losses = brute_force(hero, villain, board)
+    assert result.runouts == wins + ties + losses == 990
+    assert result.win == Fraction(wins, 990)
+    assert result.tie == Fraction(ties, 990)
+    assert result.loss == Fraction(losses, 990)
+
+
+def test_exactequity_symmetricflop_evaluatesFewerRunouts():
+    hero = tools.to_cards(['Ac', 'Ad'])
+    villain = tools.to_cards(['Kc', 'Kd'])
+    board = tools.to_cards(['Qs', 'Js', 'Ts'])
+    result = equity.exact_equity(hero, villain, board)
+    assert result.evaluated < result.runouts
+
+
+def test_exactequity_suitswapped_usesCache():
+    equity.exact_equity(tools.to_cards(['As', 'Ks']), tools.to_cards(['Qh', 'Qd']),
+                        tools.to_cards(['2c', '7c', '9h', 'Td']))
+    result = equity.exact_equity(tools.to_cards(['Ah', 'Kh']), tools.to_cards(['Qs', 'Qd']),
+                                 tools.to_cards(['2c', '7c', '9s', 'Td']))
+    assert result.cached
+
+
+def test_exactequity_turn_equityIsFraction():
+    result = equity.exact_equity(tools.to_cards(['As', 'Ks']), tools.to_cards(['Qh', 'Qd']),
+                                 tools.to_cards(['2c', '7c', '9h', 'Td']))
+    assert result.runouts == 44
+    assert result.win + result.tie + result.loss == 1
+    assert result.equity == result.win + result.tie / 2
+
+
+def test_exactequity_fullboard_1runout():
+    hero = tools.to_cards(['As', 'Ah'])
+    villain = tools.to_cards(['Ks', 'Kh'])
+    board = tools.to_cards(['2c', '7d', '9h', 'Jc', '3s'])
+    result = equity.exact_equity(hero, villain, board)
+    assert result.runouts == 1
+    assert result.win == 1
+
+
+def test_canonicalform_suitswap_sameform():
+    a = equity.canonical_form((51, 50), (10, 23))
+    b = equity.canonical_form((38, 37), (10, 49))
+    assert a == b
@@ -0,0 +1,66 @@
+"""
+  " Tests for equity_ranges.py
+  """
+import pytest
+from ..src import equity as eq
+from ..src import ranges
+from . import tools
+
+np = pytest.importorskip('numpy')
+from ..src import equity_ranges as er  # noqa: E402
+
+TURN = ['2c', '7d', 'Jh', 'Qs']
+
+
+def test_rangeequity_turn_matchesexact():
+    board = tools.to_cards(TURN)
+    result = er.range_equity('AA', 'KK,QJs', board=board)
+    for i, h in enumerate(result.hero):
+        for j, v in enumerate(result.villain):
+            if set(h) & set(v):
+                continue
+            expected = float(eq.exact_equity(h, v, board=board).equity) * 100
+            assert result.matrix[i, j] == pytest.approx(expected)
+    assert result.runouts == 48
+
+
+def test_rangeequity_matrixshape():
+    result = er.range_equity('AA', 'AKs', board=tools.to_cards(TURN))
+    assert result.matrix.shape == (6, 4)
+
+
+def test_rangeequity_sharedcard_nan():
+    result = er.range_equity('AsAh', 'AsKs,KdKh', board=tools.to_cards(TURN + ['3c']))
+    assert result.villain == [(37, 24), (51, 50)]
+    assert np.isnan(result.matrix[0, 1])
+    assert result.equity == 100
+
+
+def test_rangeequity_allshared_raiseEx():
+    with pytest.raises(ValueError):
+        er.range_equity('AsAh', 'AsKs', board=tools.to_cards(TURN + ['3c']))
+
+
+def test_rangeequity_weights_weightoverall():
+    board = tools.to_cards(TURN + ['3c'])
+    even = er.range_equity('AsAh', 'KsKh,3d3h', board=board)
+    weighted = er.range_equity('AsAh', 'KsKh:0.5,3d3h', board=board)
+    assert even.equity == pytest.approx(50)
+    assert weighted.equity == pytest.approx(100 / 3)
+
+
+def test_rangeequity_sameseed_sameresult():
+    a = er.range_equity(ranges.parse('AKs'), 'QQ', trials=50, seed=3)
+    b = er.range_equity(ranges.parse('AKs'), 'QQ', trials=50, seed=3)
+    assert a.equity == b.equity and a.runouts == 50
+
+
+def test_rangeequity_workers_matchsingle():
+    single = er.range_equity('AKs', 'QQ', trials=40, seed=3, batchsize=10)
+    multi = er.range_equity('AKs', 'QQ', trials=40, seed=3, batchsize=10, workers=2)
+    assert np.array_equal(single.matrix, multi.matrix)
+
+
+def test_rangeequity_blockedrange_raiseEx():
+    with pytest.raises(ValueError):
+        er.range_equity('AsKs', 'QQ', dead=tools.to_cards(['As']))
@@ -0,0 +1,98 @@
+"""
+  " Tests for evalcache.py
+  """
+import pickle
+import pytest
+import random
+from ..src import evalcache
+from ..src import evaluator as ev
+from ..src import playingcard as pc
+from . import tools
+
+
+def test_handkey_anyorder_samekey():
+    cards = tools.make('royalflush')
+    assert evalcache.hand_key(cards) == evalcache.hand_key(list(reversed(cards)))
+
+
+def test_handkey_joker_returnsNone():
+    assert evalcache.hand_key(tools.to_cards(['As']) + [pc.Joker()]) is None
+
+
+def test_handkey_dupes_returnsNone():
+    assert evalcache.hand_key(tools.make('dupes')) is None
+
+
+def test_getvalue_matchesevaluator():
+    cache, rng = evalcache.EvalCache(), random.Random(0)
+    for _ in range(200):
+        cards = rng.sample(pc.std_deck(), rng.randint(1, 7))
+        assert cache.get_value(cards) == ev.get_value(cards)
+
+
+def test_getvalue_repeat_countshit():
+    cache = evalcache.EvalCache()
+    cards = tools.make('fullhouse_high')
+    cache.get_value(cards)
+    cache.get_value(list(reversed(cards)))
+    assert cache.info() == evalcache.CacheInfo(hits=1, misses=1, maxsize=evalcache.MAXSIZE, currsize=1)
+
+
+def test_getvalue_joker_notcached():
+    cache = evalcache.EvalCache()
+    cards = tools.to_cards(['As', 'Ks', 'Qs', 'Js']) + [pc.Joker()]
+    assert cache.get_value(cards) == ev.get_value(cards)
+    assert len(cache) == 0
+
+
+def test_findbesthand_matchesevaluator():
+    cache, rng = evalcache.EvalCache(), random.Random(1)
+    for _ in range(100):
+        cards = rng.sample(pc.std_deck(), 7)
+        expected = ev.find_best_hand(cards, fast=True)
+        assert sorted(c.id for c in cache.find_best_hand(cards)) == sorted(c.id for c in expected)
+        assert sorted(c.id for c in cache.find_best_hand(cards)) == sorted(c.id for c in expected)
+    assert cache.hits == 100
+
+
+def test_evict_leastrecentlyused():
+    cache = evalcache.EvalCache(maxsize=2)
+    a, b, c = tools.make('royalflush'), tools.make('quads_high'), tools.make('junk')
+    cache.get_value(a)
+    cache.get_value(b)
+    cache.get_value(a)
+    cache.get_value(c)
+    assert evalcache.hand_key(b) not in cache._data
+    assert evalcache.hand_key(a) in cache._data
+
+
+def test_maxsize0_raiseEx():
+    with pytest.raises(ValueError):
+        evalcache.EvalCache(maxsize=0)
+
+
+def test_saveload_prewarms(tmpdir):
+    path = str(tmpdir.join('cache.bin'))
+    cache = evalcache.EvalCache(path=path)
+    cache.get_value(tools.make('flush_high'))
+    cache.find_best_hand(tools.make('straight_high') + tools.to_cards(['2c', '3c']))
+    cache.save()
+
+    warm = evalcache.EvalCache(path=path)
+    assert warm._data == cache._data
+    warm.get_value(tools.make('flush_high'))
+    assert warm.hits == 1
+
+
+def test_load_badmagic_raiseEx(tmpdir):
+    path = tmpdir.join('bad.bin')
+    path.write_binary(b'nope' * 4)
+    with pytest.raises(ValueError):
+        evalcache.EvalCache().load(str(path))
+
+
+def test_pickle_keepssettingsonly():
+    cache = evalcache.EvalCache(maxsize=10)
+    cache.get_value(tools.make('flush_high'))
+    copy = pickle.loads(pickle.dumps(cache))
+    assert copy.maxsize == 10 and len(copy) == 0
@@ -1,7 +1,10 @@
 """
   " Tests for evaluator.py
   """
+import itertools
+import os
 import pytest
+import random
 from ..src import playingcard as pc
 from ..src import evaluator as ev
 from . import tools
@@ -27,6 +30,11 @@ def test_iswheel_AA23_returnsFalse():
     assert ev.is_wheel(cards) is False
 
 
+def test_iswheel_A23456_returnsFalse():
+    cards = tools.to_cards(['As', '2c', '3d', '4d', '5h', '6h'])
+    assert ev.is_wheel(cards) is False
+
+
 def test_dominantsuit_1card_returnssuit():
     cards = [pc.PlayingCard('A', 's')]
     assert ev.dominant_suit(cards) == 's'
@@ -57,6 +65,27 @@ def test_dominantsuit_HigherSpades_returnsSpades():
     assert ev.dominant_suit(cards) == 's'
 
 
+def test_dominantsuit_moreclubs_returnsClubs():
+    cards = tools.to_cards(['As', 'Ks', '2c', '3c', '4c'])
+    assert ev.dominant_suit(cards) == 'c'
+
+
+def test_dominantsuit_sameranks_returnsfirstsuit():
+    cards = tools.to_cards(['Kh', 'Ac', 'Ah', 'Kc'])
+    assert ev.dominant_suit(cards) == 'h'
+
+
+def test_dominantsuit_repeatedranks_comparescards():
+    # Three Kc from a multi-deck shoe lose to Ad 2d 3d, as A beats K.
+    cards = tools.to_cards(['Kc', 'Kc', 'Kc', 'Ad', '2d', '3d'])
+    assert ev.dominant_suit(cards) == 'd'
+
+
+def test_dominantsuit_0cards_raisesValueError():
+    with pytest.raises(ValueError):
+        ev.dominant_suit([])
+
+
 def test_isset_0cards_returnsFalse():
     assert ev.is_set([])
 
@@ -89,6 +118,27 @@ def test_isstraight_nonstraight_returns0():
     assert ev.is_straight(hand) == 0
 
 
+def test_isstraight_paired_returns0():
+    hand = tools.to_cards(['2s', '2c', '3d', '4d', '5h'])
+    assert ev.is_straight(hand) == 0
+
+
+def test_isstraight_7cards_returnsbesthigh():
+    hand = tools.to_cards(['As', '2c', '3d', '4d', '5h', '6c', '6s'])
+    assert ev.is_straight(hand) == 6
+
+
+def test_isstraight_7cardswheel_returns5():
+    hand = tools.to_cards(['As', '2c', '3d', '4d', '5h', 'Kc', 'Ks'])
+    assert ev.is_straight(hand) == 5
+
+
+def test_straighthighs_everymask_matchesscan():
+    for mask in range(0x2000):
+        high = next((h for m, h in ev.STRAIGHTS if mask & m == m), 0)
+        assert ev.STRAIGHT_HIGHS[mask] == high
+
+
 def test_issuited_1card_returnsTrue(ace):
     assert ev.is_suited([ace])
 
@@ -170,6 +220,48 @@ def test_findbesthand_flush_returnsFLUSH():
     assert ev.get_type(val) == 'FLUSH'
 
 
+def test_findbesthand_4cards_returnsNone():
+    cards = tools.to_cards(['Ac', 'As', '2c', '3s'])
+    assert ev.find_best_hand(cards, fast=True) is None
+
+
+def test_findbesthand_fast_straightflush_returnsSTRAIGHTFLUSH():
+    cards = tools.to_cards(['4s', '5s', '6s', '7s', '8s', 'Ks', 'As'])
+    besthand = ev.find_best_hand(cards, fast=True)
+    assert sorted(c.peek() for c in besthand) == ['4s', '5s', '6s', '7s', '8s']
+
+
+def test_findbesthandfast_wheel_returnsSTRAIGHT():
+    cards = tools.to_cards(['Ac', 'As', '2c', '3s', '4h', '5s', '5h'])
+    value, besthand = ev.find_best_hand_fast(cards)
+    assert ev.get_type(value) == 'STRAIGHT'
+    assert value == ev.get_value(besthand)
+
+
+def test_findbesthandfast_twoflushes_returnsHigherFlush():
+    cards = tools.to_cards(['2s', '4s', '6s', '8s', 'Ts', '3h', '5h', '7h', '9h', 'Jh'])
+    value, besthand = ev.find_best_hand_fast(cards)
+    assert ev.get_type(value) == 'FLUSH'
+    assert max(besthand).rank == 'J'
+
+
+def test_findbesthandfast_joker_matchesfindbesthand():
+    cards = tools.to_cards(['2s', '4s', '6s', '8s', 'Ts', '3h']) + [pc.Joker()]
+    value, besthand = ev.find_best_hand_fast(cards)
+    assert value == ev.get_value(ev.find_best_hand(cards))
+
+
+def test_findbesthandfast_randomhands_matchfindbesthand():
+    deck, rng = pc.std_deck(), random.Random(0)
+    for size in (5, 6, 7, 8):
+        for _ in range(1000):
+            cards = rng.sample(deck, size)
+            value, besthand = ev.find_best_hand_fast(cards)
+            assert value == ev.get_value(ev.find_best_hand(cards))
+            assert value == ev.get_value(besthand)
+            assert len(set(besthand)) == 5 and set(besthand) <= set(cards)
+
+
 def test_getallgaps_1card_returns0():
     cards = tools.to_cards(['Kc', 'As'])
     assert ev.get_allgaps(cards) == 0
@@ -229,6 +321,43 @@ def test_gettype_1000000000000_raiseEx():
         ev.get_type(1000000000000)
 
 
+@pytest.mark.parametrize('handtype', [t for t in ev.HANDTYPES if t != 'INVALID'])
+def test_gettype_basevalues_returnType(handtype):
+    assert ev.get_type(ev.HANDTYPES[handtype]) == handtype
+
+
+def test_gettype_pairAces_returnsPAIR():
+    assert ev.get_type(tools.PAIR_AA) == 'PAIR'
+
+
+def test_gettype_betweenTypes_raiseEx():
+    with pytest.raises(ValueError):
+        ev.get_type(15000000000)
+
+
+def test_getdescription_nocards_returnsNoCards():
+    assert ev.get_description(-1, []) == 'No cards!'
+
+
+def test_getdescription_twopair_returnsBothPairs():
+    h = tools.make('twopair_high')
+    assert ev.get_description(ev.get_value(h), h) == "A's and K's"
+
+
+def test_getdescription_invalid_returnsHighCard():
+    h = tools.get_cards(6)
+    assert ev.get_description(-1, h) == '{} High'.format(max(h).rank)
+
+
+def test_getdescription_samevalue_cached():
+    h = tools.make('fullhouse_low')
+    value = ev.get_value(h)
+    ev.get_description(value, h)
+    hits = ev.describe_value.cache_info().hits
+    assert ev.get_description(value, h) == "2's full of 3's"
+    assert ev.describe_value.cache_info().hits == hits + 1
+
+
 def test_rankdict_0K_counts0(ace):
     rankdict = ev.rank_dict([ace])
     # 0 is the default in case there are no Aces
@@ -361,3 +490,89 @@ def test_suitedcarddict_1Spade_listlenEquals1():
     suitdict = ev.suitedcard_dict(cl)
     # Empty list is the default in case there are no Aces
     assert len(suitdict.get('s', [])) == 1
+
+
+def test_getvalue_handsizes_matchscorehand():
+    deck, rng = pc.std_deck(), random.Random(0)
+    for size in range(1, 8):
+        for _ in range(2000):
+            cards = rng.sample(deck, size)
+            assert ev.get_value(cards) == ev.score_hand(cards)
+
+
+def test_getvalue_6cards_straightranks_highcard():
+    # Only 5 card lists are scored as straights.
+    cards = tools.to_cards(['6h', '4s', '5d', '7d', '5s', '3h'])
+    assert ev.get_value(cards) == 507060403
+    assert ev.get_value(cards) < ev.HANDTYPES['PAIR']
+
+
+def test_getvalue_6cards_broadwaypairedace_notstraight():
+    cards = tools.to_cards(['As', 'Ks', 'Qs', 'Js', 'Ts', 'Ah'])
+    assert ev.get_value(cards) < ev.HANDTYPES['STRAIGHT']
+
+
+def test_getvalue_allrankpatterns_matchscorehand():
+    # One unsuited (and where possible, one suited) hand for every rank pattern.
+    for combo in itertools.combinations_with_replacement(pc.std_deck()[:13], 5):
+        ranks = [c.rank for c in combo]
+        if max(ranks.count(r) for r in ranks) > 4:
+            continue
+        suits = [pc.SUITS[ranks[:i].count(r)] for i, r in enumerate(ranks)]
+        suits[0] = 'd' if len(set(suits)) == 1 else suits[0]
+        unsuited = [pc.PlayingCard(r, s) for r, s in zip(ranks, suits)]
+        assert ev.get_value(unsuited) == ev.score_hand(unsuited)
+        if len(set(ranks)) == 5:
+            suited = [pc.PlayingCard(r, 's') for r in ranks]
+            assert ev.get_value(suited) == ev.score_hand(suited)
+
+
+def test_getvalue_joker_matchscorehand():
+    cards = tools.to_cards(['As', 'Ks', 'Qs', 'Js']) + [pc.Joker()]
+    assert ev.get_value(cards) == ev.score_hand(cards)
+
+
+def test_getvalue_dupes_matchscorehand():
+    cards = tools.make('dupes')
+    assert ev.get_value(cards) == ev.score_hand(cards)
+
+
+@pytest.mark.slow
+@pytest.mark.skipif('PYCARDS_SLOW' not in os.environ, reason='Set PYCARDS_SLOW to sweep every hand.')
+def test_getvalue_all5cardhands_matchscorehand():
+    count = 0
+    for cards in itertools.combinations(pc.std_deck(), 5):
+        assert ev.get_value(cards) == ev.score_hand(cards)
+        count += 1
+    assert count == 2598960
+
+
+@pytest.mark.parametrize('hand, drawtype, outs', [
+    ('OESFD', 'STRAIGHT FLUSH DRAW', 15),
+    ('GSSFD', 'STRAIGHT FLUSH DRAW', 12),
+    ('flushdrawA', 'FLUSH DRAW', 9),
+    ('OESD', 'STRAIGHT DRAW', 8),
+    ('GSSD', 'GUTSHOT DRAW', 4),
+    ('wheeldraw', 'GUTSHOT DRAW', 4),
+    ('BDFD1', 'BACKDOOR FLUSH DRAW', 0),
+    ('BDSD1', 'BACKDOOR STRAIGHT DRAW', 0),
+    ('AKs', '2 SUITED DRAW', 0),
+    ('23', '2 CONNECTED DRAW', 0),
+    ('AA', 'HIGH CARD DRAW', 0),
+])
+def test_getdraw_fixtures(hand, drawtype, outs):
+    assert ev.get_draw(tools.make(hand)) == (drawtype, outs)
+
+
+def test_getdraw_madestraight_nostraightdraw():
+    assert ev.get_draw(tools.make('straight_high')).type == '2 SUITED DRAW'
+
+
+def test_getdraw_madeflush_noflushdraw():
+    cards = tools.to_cards(['2s', '5s', '8s', 'Js', 'Ks'])
+    assert ev.get_draw(cards) == ('HIGH CARD DRAW', 0)
+
+
+def test_getdraws_matchesgetdraw():
+    hands = [tools.make(h) for h in ('OESFD', 'GSSD', 'BDFD1')]
+    assert ev.get_draws(hands) == [ev.get_draw(h) for h in hands]
@@ -0,0 +1,66 @@
+"""
+  " Tests for evaluator_batch.py
+  """
+import pytest
+from ..src import playingcard as pc
+from ..src import evaluator as ev
+from . import tools
+
+np = pytest.importorskip('numpy')
+from ..src import evaluator_batch as eb  # noqa: E402
+
+
+def test_toarray_2hands_shape2x5():
+    hands = [tools.make('royalflush'), tools.make('junk')]
+    assert eb.to_array(hands).shape == (2, 5)
+
+
+def test_toarray_As_id51():
+    assert eb.to_array([tools.to_cards(['As'])])[0][0] == 51
+
+
+def test_evaluate_rankedhands_matchgetvalue():
+    hands = [tools.RANKEDHANDS[k] for k in sorted(tools.RANKEDHANDS)]
+    expected = [ev.get_value(h) for h in hands]
+    assert ev.batch(eb.to_array(hands)).tolist() == expected
+
+
+def test_evaluate_returnsInt64():
+    assert eb.evaluate(eb.random_hands(10, 5, seed=1)).dtype == np.int64
+
+
+def test_evaluate_random5cards_matchgetvalue():
+    ids = eb.random_hands(20000, 5, seed=1)
+    deck = pc.std_deck()
+    expected = [ev.get_value([deck[i] for i in row]) for row in ids.tolist()]
+    assert eb.evaluate(ids).tolist() == expected
+
+
+def test_evaluate_4cards_matchgetvalue():
+    ids = eb.random_hands(2000, 4, seed=2)
+    deck = pc.std_deck()
+    expected = [ev.get_value([deck[i] for i in row]) for row in ids.tolist()]
+    assert eb.evaluate(ids).tolist() == expected
+
+
+@pytest.mark.parametrize('size', [6, 7])
+def test_evaluate_bigger_hands_matchfindbesthand(size):
+    ids = eb.random_hands(2000, size, seed=size)
+    deck = pc.std_deck()
+    expected = [ev.get_value(ev.find_best_hand([deck[i] for i in row])) for row in ids.tolist()]
+    assert eb.evaluate(ids).tolist() == expected
+
+
+def test_evaluate_joker_raiseEx():
+    with pytest.raises(ValueError):
+        eb.evaluate([[0, 1, 2, 3, pc.JOKER_ID]])
+
+
+def test_evaluate_1darray_raiseEx():
+    with pytest.raises(ValueError):
+        eb.evaluate([0, 1, 2, 3, 4])
+
+
+def test_benchmark_returnsTimings():
+    result = eb.benchmark(qty=100, size=7, scalar_qty=10)
+    assert result['batch_us'] > 0 and result['scalar_us'] > 0
@@ -0,0 +1,84 @@
+"""
+  " Tests for evaluator_wild.py
+  """
+import itertools
+import pytest
+import random
+from ..src import evaluator as ev
+from ..src import evaluator_wild as ew
+from ..src import playingcard as pc
+from . import tools
+
+
+def wild(texts, jokers=1):
+    return tools.to_cards(texts) + [pc.Joker() for _ in range(jokers)]
+
+
+def substitute_all(cards):
+    """ Values the hand by trying every distinct card not in it for each Joker. """
+    held = {c.id for c in cards}
+    others = [c for c in cards if c.id != pc.JOKER_ID]
+    jokers = len(cards) - len(others)
+    stub = [c for c in pc.std_deck() if c.id not in held]
+    return max(ev.get_value(others + list(subs)) for subs in itertools.combinations(stub, jokers))
+
+
+def test_getvalue_nojokers_matchesevaluator():
+    cards = tools.make('fullhouse_high')
+    assert ew.get_value(cards) == ev.get_value(cards)
+
+
+def test_getvalue_4tostraightflush_royalflush():
+    assert ew.get_value(wild(['As', 'Ks', 'Qs', 'Js'])) == ev.HANDTYPES['ROYAL FLUSH']
+
+
+def test_getvalue_trips_quads():
+    cards = wild(['Ks', 'Kh', 'Kd', '2c'])
+    assert ev.get_type(ew.get_value(cards)) == 'QUADS'
+
+
+def test_getvalue_quads_nofiveofakind():
+    cards = wild(['Ks', 'Kh', 'Kd', 'Kc'])
+    assert ew.get_value(cards) == ev.get_value(tools.to_cards(['Ks', 'Kh', 'Kd', 'Kc', 'As']))
+
+
+def test_getvalue_5jokers_royalflush():
+    assert ew.get_value([pc.Joker() for _ in range(5)]) == ev.HANDTYPES['ROYAL FLUSH']
+
+
+def test_getvalue_1card1joker_pair():
+    assert ew.get_value(wild(['7h'])) == ev.get_value(tools.to_cards(['7h', '7s']))
+
+
+def test_getvalue_6cards_raiseEx():
+    with pytest.raises(ValueError):
+        ew.get_value(wild(['2c', '3c', '4c', '5c', '6c']))
+
+
+@pytest.mark.parametrize('jokers', [1, 2])
+def test_getvalue_random_matchessubstitution(jokers):
+    rng = random.Random(jokers)
+    for _ in range(100):
+        size = rng.randint(jokers, 5)
+        cards = rng.sample(pc.std_deck(), size - jokers) + [pc.Joker() for _ in range(jokers)]
+        assert ew.get_value(cards) == substitute_all(cards)
+
+
+def test_besthand_7cards_keepsjoker():
+    cards = wild(['2c', '7d', 'Ah', 'Ad', 'Kc', '9s'])
+    value, hand = ew.best_hand(cards)
+    assert ev.get_type(value) == 'TRIPS'
+    assert any(c.id == pc.JOKER_ID for c in hand)
+
+
+def test_bestvalue_nojokers_matchesfindbesthand():
+    cards = random.Random(3).sample(pc.std_deck(), 7)
+    assert ew.best_value(cards) == ev.find_best_hand_fast(cards)[0]
+
+
+def test_bestvalue_7cards_matchesbestsubset():
+    rng = random.Random(4)
+    for _ in range(20):
+        cards = rng.sample(pc.std_deck(), 6) + [pc.Joker()]
+        expected = max(ew.get_value(c) for c in itertools.combinations(cards, 5))
+        assert ew.best_value(cards) == expected
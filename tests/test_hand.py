@@ -2,8 +2,11 @@
   " Tests for hand.py
   """
 import pytest
+import random
 from ..src import hand
+from ..src import evaluator as ev
 from ..src import playingcard as pc
+from . import tools
 
 
 @pytest.fixture
@@ -107,3 +110,81 @@ def test_reveal_2cards_bothcardsUp(_hand):
 def test_reveal_1card_faceup(_hand):
     _hand.reveal()
     assert _hand.cards[0].hidden is False
+
+
+# Tests for PokerHand
+
+def test_pokerhand_init_valueINVALID():
+    h = hand.PokerHand()
+    assert h.value == ev.HANDTYPES['INVALID']
+    assert h.description == 'No cards!'
+
+
+def test_pokerhand_add_pair_returnsPAIR():
+    h = hand.PokerHand()
+    for c in tools.to_cards(['As', 'Ah']):
+        h.add(c)
+    assert h.rank == 'PAIR'
+    assert h.value == ev.get_value(h.cards)
+
+
+def test_pokerhand_add_royalflush_valueMatches():
+    h = hand.PokerHand()
+    for c in tools.make('royalflush'):
+        h.add(c)
+    assert h.rank == 'ROYAL FLUSH'
+    assert h.description == 'A High'
+
+
+def test_pokerhand_discard_updatesValue():
+    h = hand.PokerHand()
+    for c in tools.make('fullhouse_high'):
+        h.add(c)
+    h.discard(pc.PlayingCard('K', 'd'))
+    assert h.rank == 'TRIPS'
+    assert h.value == ev.get_value(h.cards)
+
+
+def test_pokerhand_description_lazy():
+    h = hand.PokerHand()
+    h.add(pc.PlayingCard('A', 's'))
+    assert h._description is None
+    assert h.description == "A High"
+    h.add(pc.PlayingCard('A', 'd'))
+    assert h._description is None
+    assert h.description == "A's"
+
+
+def test_pokerhand_joker_matchesGetValue():
+    h = hand.PokerHand()
+    for c in tools.to_cards(['As', 'Ks']) + [pc.Joker()]:
+        h.add(c)
+    assert h.value == ev.get_value(h.cards)
+
+
+def test_pokerhand_7cards_scoredFromCounts(monkeypatch):
+    cards = tools.to_cards(['6h', '6s', '5d', '5s', '3h', '5c', '3d'])
+    expected = [ev.get_value(cards[:i]) for i in range(6, 8)]
+    monkeypatch.setattr(ev, 'get_value', None)
+    h = hand.PokerHand()
+    values = []
+    for c in cards:
+        h.add(c)
+        values.append(h.value)
+    assert values[5:] == expected
+    assert h.rank == 'FULL HOUSE'
+
+
+def test_pokerhand_randomAddDiscard_matchesGetValue():
+    rng = random.Random(0)
+    deck = pc.std_deck()
+    h = hand.PokerHand()
+    for _ in range(3000):
+        if len(h) < 7 and (len(h) == 0 or rng.random() < 0.6):
+            c = deck.pop(rng.randrange(len(deck)))
+            h.add(c)
+        else:
+            c = h.discard(rng.choice(h.cards))
+            deck.append(c)
+        if h.cards:
+            assert h.value == ev.get_value(h.cards)
@@ -34,3 +34,11 @@ def test_roundnumber_10pt4_returns10():
 
 def test_roundnumber_1_returns1():
     assert numtools.round_number(1) == 1
+
+
+def test_popcount_0_returns0():
+    assert numtools.popcount(0) == 0
+
+
+def test_popcount_52bits_returns52():
+    assert numtools.popcount((1 << 52) - 1) == 52
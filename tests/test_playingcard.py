@@ -168,6 +168,57 @@ def test_val_2_returns2():
     assert instance.val() == 2
 
 
+def test_id_2c_returns0():
+    assert pc.PlayingCard('2', 'c').id == 0
+
+
+def test_id_As_returns51():
+    assert pc.PlayingCard('A', 's').id == 51
+
+
+def test_id_stddeck_allunique():
+    assert sorted(c.id for c in pc.std_deck()) == list(range(52))
+
+
+def test_suitbit_hearts_returns4():
+    assert pc.PlayingCard('A', 'h').suitbit == 4
+
+
+def test_rankbit_2_returns1():
+    assert pc.PlayingCard('2', 'h').rankbit == 1
+
+
+def test_rankbit_A_returns4096():
+    assert pc.PlayingCard('A', 'c').rankbit == 4096
+
+
+def test_eq_SameCard_returnsTrue():
+    assert pc.PlayingCard('A', 's') == pc.PlayingCard('A', 's')
+
+
+def test_eq_DiffSuits_returnsFalse():
+    assert pc.PlayingCard('A', 's') != pc.PlayingCard('A', 'h')
+
+
+def test_hash_SameCard_equal():
+    assert hash(pc.PlayingCard('K', 'd')) == hash(pc.PlayingCard('K', 'd'))
+
+
+def test_slots_newattribute_raiseEx():
+    c = pc.PlayingCard('A', 's')
+    with pytest.raises(AttributeError):
+        c.color = 'black'
+
+
+def test_hide_onecard_othercopyUnchanged():
+    c1 = pc.PlayingCard('A', 's')
+    c2 = pc.PlayingCard('A', 's')
+    c1.unhide()
+    assert c1.peek() == 'As'
+    assert str(c1) == 'As'
+    assert str(c2) == 'Xx'
+
+
 # Tests for Joker
 
 def test_val_JOKER_Z_returns15():
@@ -185,3 +236,64 @@ def test_joker_lt_Ace_returnFalse():
     ace = pc.PlayingCard('A', 's')
     j = pc.Joker()
     assert not j < ace
+
+
+def test_id_JOKER_returns52():
+    assert pc.Joker().id == pc.JOKER_ID
+
+
+def test_copy_samecard_newobject():
+    c = pc.PlayingCard('T', 'd')
+    copy = c.copy()
+    assert copy == c and copy is not c
+    assert (copy.rank, copy.suit, copy.value, copy.rankbit, copy.suitbit) == ('T', 'd', 10, 256, 2)
+
+
+def test_copy_joker_staysJoker():
+    assert isinstance(pc.Joker().copy(), pc.Joker)
+
+
+@pytest.mark.parametrize('text', ['AsKdQh', 'As Kd Qh', 'As,Kd,Qh', 'AsKd Qh', ['As', 'Kd', 'Qh']])
+def test_parsecards_formats_sameids(text):
+    assert pc.parse_cards(text, ids=True) == [51, 24, 36]
+
+
+def test_parsecards_newcards():
+    cards = pc.parse_cards('As As')
+    assert cards[0] == cards[1] and cards[0] is not cards[1]
+    assert cards[0] is not pc.INTERNED[51]
+
+
+def test_parsecards_interned_shared():
+    assert pc.parse_cards('As', interned=True)[0] is pc.INTERNED[51]
+
+
+def test_parsecards_joker():
+    assert isinstance(pc.parse_cards('Zs')[0], pc.Joker)
+
+
+def test_parsecards_empty():
+    assert pc.parse_cards('') == []
+
+
+@pytest.mark.parametrize('text, token, position', [
+    ('AsKx', 'Kx', 2),
+    ('As Kd 1h', '1h', 6),
+    ('AsKd Q', 'Q', 5),
+    (['As', 'Ad', 'x'], 'x', 2),
+])
+def test_parsecards_bad_raiseCardParseError(text, token, position):
+    with pytest.raises(pc.CardParseError) as e:
+        pc.parse_cards(text)
+    assert (e.value.token, e.value.position) == (token, position)
+
+
+def test_cardparseerror_isValueError():
+    with pytest.raises(ValueError):
+        pc.parse_cards('Xx')
+
+
+def test_cardparseerror_notchained():
+    with pytest.raises(pc.CardParseError) as e:
+        pc.parse_cards('As Kx')
+    assert e.value.__cause__ is None and e.value.__suppress_context__
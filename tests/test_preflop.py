@@ -0,0 +1,108 @@
+"""
+  " Tests for preflop.py
+  """
+import pytest
+from ..src import preflop
+from . import tools
+
+
+def test_classname_0_returnsAA():
+    assert preflop.class_name(0) == 'AA'
+
+
+def test_classname_1_returnsAKs():
+    assert preflop.class_name(1) == 'AKs'
+
+
+def test_classname_13_returnsAKo():
+    assert preflop.class_name(13) == 'AKo'
+
+
+def test_classindex_AKsCards_returns1():
+    assert preflop.class_index(tools.to_cards(['Ks', 'As'])) == 1
+
+
+def test_classindex_AKoCards_returns13():
+    assert preflop.class_index(tools.to_cards(['As', 'Kd'])) == 13
+
+
+def test_classindex_badname_raiseEx():
+    with pytest.raises(ValueError):
+        preflop.class_index('AAs')
+
+
+def test_classcombos_counts():
+    assert len(preflop.class_combos(preflop.class_index('AA'))) == 6
+    assert len(preflop.class_combos(preflop.class_index('AKs'))) == 4
+    assert len(preflop.class_combos(preflop.class_index('AKo'))) == 12
+    assert sum(len(preflop.class_combos(i)) for i in range(169)) == 1326
+
+
+def test_comboindex_allunique():
+    indexes = {preflop.combo_index(c) for c in preflop.COMBO_IDS}
+    assert indexes == set(range(1326))
+
+
+def test_comboindex_samecard_raiseEx():
+    with pytest.raises(ValueError):
+        preflop.combo_index((5, 5))
+
+
+def test_generate_2rows_otherRowsLeft(tmp_path):
+    path = str(tmp_path / 'pf.eq')
+    assert preflop.generate(path, trials=10, seed=1, rows=2) == 167
+    table = preflop.PreflopTable(path)
+    assert table.is_done(0) and table.is_done(1)
+    assert not table.is_done(2)
+
+
+def test_generate_resume_continuesRows(tmp_path):
+    path = str(tmp_path / 'pf.eq')
+    preflop.generate(path, trials=10, seed=1, rows=1)
+    assert preflop.generate(path, trials=10, rows=1) == 167
+    assert preflop.PreflopTable(path).is_done(1)
+
+
+def test_generate_resumeDifferentTrials_raiseEx(tmp_path):
+    path = str(tmp_path / 'pf.eq')
+    preflop.generate(path, trials=10, seed=1, rows=1)
+    with pytest.raises(ValueError):
+        preflop.generate(path, trials=20, rows=1)
+
+
+def test_generate_workers_sameAsSerial(tmp_path):
+    serial, parallel = str(tmp_path / 'a.eq'), str(tmp_path / 'b.eq')
+    preflop.generate(serial, trials=5, seed=3, rows=2)
+    preflop.generate(parallel, trials=5, seed=3, rows=2, workers=2)
+    with open(serial, 'rb') as a, open(parallel, 'rb') as b:
+        assert a.read() == b.read()
+
+
+def test_preflopequity_AAvsKK_mirrored(tmp_path):
+    path = str(tmp_path / 'pf.eq')
+    preflop.generate(path, trials=200, seed=1, rows=1)
+    aa_kk = preflop.preflop_equity('AA', 'KK', path)
+    assert aa_kk > 65
+    assert preflop.preflop_equity('KK', 'AA', path) == pytest.approx(100 - aa_kk, abs=0.01)
+
+
+def test_preflopequity_cards_useClasses(tmp_path):
+    path = str(tmp_path / 'pf.eq')
+    preflop.generate(path, trials=20, seed=1, rows=1)
+    hero = tools.to_cards(['As', 'Ad'])
+    villain = tools.to_cards(['Ks', 'Qs'])
+    assert preflop.preflop_equity(hero, villain, path) == preflop.preflop_equity('AA', 'KQs', path)
+
+
+def test_preflopequity_notgenerated_raiseEx(tmp_path):
+    path = str(tmp_path / 'pf.eq')
+    preflop.generate(path, trials=10, seed=1, rows=1)
+    with pytest.raises(ValueError):
+        preflop.preflop_equity('KK', 'QQ', path)
+
+
+def test_preflop_badfile_raiseEx(tmp_path):
+    path = tmp_path / 'junk.eq'
+    path.write_bytes(b'\0' * 64)
+    with pytest.raises(ValueError):
+        preflop.PreflopTable(str(path))
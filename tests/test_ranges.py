@@ -0,0 +1,87 @@
+"""
+  " Tests for ranges.py
+  """
+import pytest
+import random
+from ..src import preflop
+from ..src import ranges
+from . import tools
+
+
+def classes(rng):
+    return {preflop.class_name(preflop.class_index(c)) for c in rng.combos()}
+
+
+@pytest.mark.parametrize('text, expected', [
+    ('AA', {'AA'}),
+    ('AK', {'AKs', 'AKo'}),
+    ('KAs', {'AKs'}),
+    ('QQ+', {'QQ', 'KK', 'AA'}),
+    ('AJs+', {'AJs', 'AQs', 'AKs'}),
+    ('KTo+', {'KTo', 'KJo', 'KQo'}),
+    ('A2s-A4s', {'A2s', 'A3s', 'A4s'}),
+    ('44-22', {'22', '33', '44'}),
+    ('AA, KQs', {'AA', 'KQs'}),
+])
+def test_parse_classes(text, expected):
+    assert classes(ranges.parse(text)) == expected
+
+
+def test_parse_everything_1326combos():
+    full = ranges.parse('22+,A2+,K2+,Q2+,J2+,T2+,92+,82+,72+,62+,52+,42+,32')
+    assert len(full) == 1326
+
+
+def test_parse_exactcombo_1combo():
+    rng = ranges.parse('AsKs')
+    assert list(rng.combos()) == [(51, 50)]
+
+
+def test_parse_weight_storedpercombo():
+    rng = ranges.parse('QQ:0.5,AKs')
+    assert rng.weight(tools.to_cards(['Qs', 'Qh'])) == 0.5
+    assert rng.weight(tools.to_cards(['As', 'Ks'])) == 1.0
+    assert rng.weight(tools.to_cards(['As', 'Kd'])) == 0
+
+
+def test_parse_laterweightwins():
+    assert ranges.parse('TT+,AA:0.25').weight(tools.to_cards(['As', 'Ah'])) == 0.25
+
+
+@pytest.mark.parametrize('text', ['AAs', 'AKx', 'A2s-K5s', 'A2s-A5o', 'QQ:0', 'QQ:2', 'ZZ'])
+def test_parse_bad_raiseEx(text):
+    with pytest.raises(ValueError):
+        ranges.parse(text)
+
+
+def test_contains():
+    rng = ranges.parse('AKs')
+    assert tools.to_cards(['Ks', 'As']) in rng
+    assert tools.to_cards(['Kd', 'As']) not in rng
+
+
+def test_combos_dead_removesblocked():
+    rng = ranges.parse('AA')
+    assert len(list(rng.combos(tools.to_cards(['As'])))) == 3
+
+
+def test_combos_isgenerator():
+    assert next(ranges.parse('AA').combos()) == (25, 12)
+
+
+def test_sample_weighted():
+    rng = ranges.parse('AA,KK:0.5')
+    picks = rng.sample(2000, dead=tools.to_cards(['As']), rng=random.Random(0))
+    aces = sum(1 for a, b in picks if a % 13 == 12)
+    assert 850 < aces < 1150
+
+
+def test_sample_mostlyblocked_fallsback():
+    rng = ranges.parse('AA,KhKs')
+    dead = tools.to_cards(['Ac', 'Ad', 'Ah', 'As'])
+    assert rng.sample(5, dead=dead, rng=random.Random(0)) == [(50, 37)] * 5
+
+
+def test_sample_allblocked_raiseEx():
+    with pytest.raises(ValueError):
+        ranges.parse('AsKs').sample(dead=tools.to_cards(['As']))
@@ -93,17 +93,14 @@ HANDS = {
 
 
 def to_card(string, hidden=True):
-    c = pc.PlayingCard(*string)
-    if hidden:
-        c.hidden = True
-    else:
-        c.hidden = False
-    return c
+    return to_cards([string], hidden)[0]
 
 
 def to_cards(strings, hidden=True):
     # Unhide for testing purposes
-    cards = [to_card(x, hidden) for x in strings]
+    cards = pc.parse_cards(strings)
+    for c in cards:
+        c.hidden = hidden
     return cards
 
 